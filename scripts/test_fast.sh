@@ -0,0 +1,8 @@
+#!/usr/bin/env sh
+# Fast tier: in-memory unit tests marked `fast`, spread over all cores.
+# Extra arguments are passed through to pytest.
+# Entry-point plugin autoloading is off; only the plugins the tier uses are loaded.
+set -e
+cd "$(dirname "$0")/.."
+export PYTEST_DISABLE_PLUGIN_AUTOLOAD=1
+exec uv run pytest -p asyncio -p xdist -p pytest_cov -m fast -n auto --dist=loadgroup -p no:cacheprovider -p no:stepwise --no-header -q --no-cov "$@"
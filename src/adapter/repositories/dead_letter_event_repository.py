@@ -85,7 +85,7 @@ class DeadLetterEventRepository(IDeadLetterEventRepository):
         """
         stmt = (
             select(DeadLetterEvent)
-            .where(DeadLetterEvent.resolved == False)
+            .where(DeadLetterEvent.resolved == False)  # noqa: E712 - SQL expression
             .order_by(DeadLetterEvent.created_at.asc())
         )
         result = await self.session.execute(stmt)
@@ -5,6 +5,9 @@ Artifact Service - Handles artifact creation, versioning, and storage
 import os
 from pathlib import Path
 from typing import Dict, Any
+
+import aiofiles
+
 from src.domain.artifact import Artifact
 from src.domain.enums import ArtifactType
 from src.app.repositories.artifact_repository import IArtifactRepository
@@ -55,7 +58,7 @@ class ArtifactService:
         next_version = max_version + 1
 
         # Generate file path and store content
-        content_url = self._store_content(task_id, artifact_type, next_version, content)
+        content_url = await self._store_content(task_id, artifact_type, next_version, content)
 
         # Create artifact entity matching the Artifact model schema
         artifact = Artifact(
@@ -71,7 +74,7 @@ class ArtifactService:
         created_artifact = await self.artifact_repo.create(artifact)
         return created_artifact
 
-    def _store_content(
+    async def _store_content(
         self, task_id: str, artifact_type: ArtifactType, version: int, content: str
     ) -> str:
         """
@@ -96,9 +99,9 @@ class ArtifactService:
         filename = f"{artifact_type.value}_v{version}.txt"
         file_path = task_dir / filename
 
-        # Write content to file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Write content to file without blocking the event loop
+        async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
+            await f.write(content)
 
         # Return absolute path (for database storage)
         return str(file_path)
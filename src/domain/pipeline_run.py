@@ -64,11 +64,11 @@ class PipelineRun(BaseModel, table=True):
             self.pause_reasons.remove(reason.value)
             self.updated_at = datetime.utcnow()
 
-    def is_expired(self) -> bool:
-        """Check if pause has expired"""
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """Check if pause has expired (as of ``now``, defaults to UTC now)"""
         if self.pause_expires_at is None:
             return False
-        return datetime.utcnow() > self.pause_expires_at
+        return (now or datetime.utcnow()) > self.pause_expires_at
 
     # Legacy methods for backward compatibility
 
@@ -56,9 +56,9 @@ class RetryJob(BaseModel, table=True):
         self.status = RetryStatus.failed
         self.processed_at = datetime.utcnow()
 
-    def is_ready(self) -> bool:
-        """Check if retry job is ready to be processed"""
+    def is_ready(self, now: Optional[datetime] = None) -> bool:
+        """Check if retry job is ready to be processed (as of ``now``, defaults to UTC now)"""
         return (
             self.status == RetryStatus.pending
-            and self.scheduled_at <= datetime.utcnow()
+            and self.scheduled_at <= (now or datetime.utcnow())
         )
@@ -1,47 +1,88 @@
 import pytest
+import itertools
 import os
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import AsyncMock
+from src.app.services import artifact_service as artifact_service_module
+from src.app.repositories.artifact_repository import IArtifactRepository
 from src.app.services.artifact_service import ArtifactService
 from src.domain.artifact import Artifact
 from src.domain.enums import ArtifactType
 
 
-@pytest.fixture
-def temp_storage():
-    """Create a temporary storage directory"""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    # Cleanup
-    shutil.rmtree(temp_dir, ignore_errors=True)
+# Real filesystem IO through ArtifactService - excluded by `pytest -m "not slow"`
+pytestmark = pytest.mark.slow
 
+CONCURRENT_CREATIONS = 3
 
-@pytest.fixture
+
+async def _echo_artifact(artifact):
+    """Repository create stub - returns the artifact it was given"""
+    return artifact
+
+
+def _stored_files(storage_root: str, task_id: str) -> set:
+    """List the file names stored for a task with a single directory scan"""
+    with os.scandir(Path(storage_root) / task_id) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+@pytest.fixture(scope="module")
+def temp_storage(tmp_path_factory):
+    """Create a temporary storage directory (unique per module and per xdist worker)"""
+    return str(tmp_path_factory.mktemp("artifacts"))
+
+
+@pytest.fixture(scope="module")
 def mock_artifact_repo():
-    return AsyncMock()
+    """Shared repository mock - spec'd so typos in repo method names fail loudly"""
+    return AsyncMock(spec=IArtifactRepository)
+
+
+@pytest.fixture(scope="module")
+def service(mock_artifact_repo, temp_storage):
+    """Shared ArtifactService - the storage root is created only once per module"""
+    return ArtifactService(
+        artifact_repo=mock_artifact_repo,
+        storage_root=temp_storage,
+    )
+
+
+@pytest.fixture
+def service_factory(mock_artifact_repo):
+    """Build a fresh ArtifactService for tests that exercise the constructor"""
+
+    def _make(storage_root: str) -> ArtifactService:
+        return ArtifactService(artifact_repo=mock_artifact_repo, storage_root=storage_root)
+
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def _isolate_shared_service(mock_artifact_repo, temp_storage):
+    """Reset the shared repo mock and empty the shared storage root between tests"""
+    mock_artifact_repo.reset_mock(return_value=True, side_effect=True)
+    yield
+    # The tree is at most a few tiny files per task dir - unlink/rmdir directly
+    # (deepest paths first) instead of paying for shutil.rmtree's walk
+    for path in sorted(Path(temp_storage).rglob("*"), reverse=True):
+        if path.is_dir():
+            path.rmdir()
+        else:
+            path.unlink(missing_ok=True)
 
 
 @pytest.mark.asyncio
-async def test_create_artifact_success(mock_artifact_repo, temp_storage):
+async def test_create_artifact_success(service, mock_artifact_repo, temp_storage):
     """Test basic artifact creation with versioning and file storage"""
     # Arrange
     mock_artifact_repo.get_max_version.return_value = 0  # First version
 
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=temp_storage,
-    )
-
     task_id = "task-123"
     content = "This is PRD content"
 
     # Mock repository create to return the artifact
-    async def create_mock(artifact):
-        return artifact
-
-    mock_artifact_repo.create.side_effect = create_mock
+    mock_artifact_repo.create.side_effect = _echo_artifact
 
     # Act
     artifact = await service.create_artifact(
@@ -74,20 +115,12 @@ async def test_create_artifact_success(mock_artifact_repo, temp_storage):
 
 
 @pytest.mark.asyncio
-async def test_artifact_versioning_auto_increment(mock_artifact_repo, temp_storage):
+async def test_artifact_versioning_auto_increment(service, mock_artifact_repo, temp_storage):
     """Test that versions auto-increment correctly"""
     # Arrange
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=temp_storage,
-    )
-
     task_id = "task-123"
 
-    async def create_mock(artifact):
-        return artifact
-
-    mock_artifact_repo.create.side_effect = create_mock
+    mock_artifact_repo.create.side_effect = _echo_artifact
 
     # Create version 1 (max_version = 0)
     mock_artifact_repo.get_max_version.return_value = 0
@@ -125,26 +158,20 @@ async def test_artifact_versioning_auto_increment(mock_artifact_repo, temp_stora
     assert artifact_v3.version == 3
 
     # Verify all 3 files exist
-    assert (Path(temp_storage) / task_id / "document_v1.txt").exists()
-    assert (Path(temp_storage) / task_id / "document_v2.txt").exists()
-    assert (Path(temp_storage) / task_id / "document_v3.txt").exists()
+    assert _stored_files(temp_storage, task_id) >= {
+        "document_v1.txt",
+        "document_v2.txt",
+        "document_v3.txt",
+    }
 
 
 @pytest.mark.asyncio
-async def test_artifact_multiple_types_same_task(mock_artifact_repo, temp_storage):
+async def test_artifact_multiple_types_same_task(service, mock_artifact_repo, temp_storage):
     """Test that different artifact types for same task have independent versioning"""
     # Arrange
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=temp_storage,
-    )
-
     task_id = "task-123"
 
-    async def create_mock(artifact):
-        return artifact
-
-    mock_artifact_repo.create.side_effect = create_mock
+    mock_artifact_repo.create.side_effect = _echo_artifact
 
     # Create document artifact (version 1)
     mock_artifact_repo.get_max_version.return_value = 0
@@ -187,30 +214,29 @@ async def test_artifact_multiple_types_same_task(mock_artifact_repo, temp_storag
     assert doc_artifact_v2.artifact_type == ArtifactType.document
 
     # Verify files exist
-    assert (Path(temp_storage) / task_id / "document_v1.txt").exists()
-    assert (Path(temp_storage) / task_id / "code_v1.txt").exists()
-    assert (Path(temp_storage) / task_id / "document_v2.txt").exists()
+    assert _stored_files(temp_storage, task_id) >= {
+        "document_v1.txt",
+        "code_v1.txt",
+        "document_v2.txt",
+    }
 
 
 @pytest.mark.asyncio
-async def test_artifact_file_storage_structure(mock_artifact_repo, temp_storage):
-    """Test that artifact files are stored in correct directory structure"""
-    # Arrange
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=temp_storage,
-    )
-
-    mock_artifact_repo.get_max_version.return_value = 0
+async def test_storage_layout_and_url(service_factory, mock_artifact_repo, tmp_path):
+    """Test storage root creation, on-disk layout and content_url format in one flow"""
+    # Arrange - storage root does not exist until the service is constructed
+    storage_path = tmp_path / "new_artifacts_dir"
+    assert not storage_path.exists()
 
-    async def create_mock(artifact):
-        return artifact
+    service = service_factory(str(storage_path))
+    assert storage_path.is_dir()
 
-    mock_artifact_repo.create.side_effect = create_mock
+    mock_artifact_repo.get_max_version.return_value = 0
+    mock_artifact_repo.create.side_effect = _echo_artifact
 
     # Act
     task_id = "task-abc-123"
-    await service.create_artifact(
+    artifact = await service.create_artifact(
         task_id=task_id,
         pipeline_run_id="run-1",
         step_run_id="step-run-1",
@@ -218,26 +244,46 @@ async def test_artifact_file_storage_structure(mock_artifact_repo, temp_storage)
         content="Test content",
     )
 
-    # Assert
-    task_dir = Path(temp_storage) / task_id
-    assert task_dir.exists()
+    # Assert - files are stored as {storage_root}/{task_id}/{type}_v{version}.txt
+    task_dir = storage_path / task_id
     assert task_dir.is_dir()
+    assert (task_dir / "document_v1.txt").is_file()
 
-    artifact_file = task_dir / "document_v1.txt"
-    assert artifact_file.exists()
-    assert artifact_file.is_file()
+    # content_url lives in the content dict
+    assert task_id in artifact.content["url"]
+    assert "document_v1.txt" in artifact.content["url"]
 
 
 @pytest.mark.asyncio
-async def test_read_content_success(mock_artifact_repo, temp_storage):
-    """Test reading artifact content from filesystem"""
+async def test_create_artifact_does_not_block_on_file_write(
+    service, mock_artifact_repo, temp_storage, monkeypatch
+):
+    """Test that artifact content is written via aiofiles, not a blocking open()"""
     # Arrange
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=temp_storage,
+    def blocking_open(*args, **kwargs):
+        raise AssertionError("ArtifactService must not call blocking open() in the event loop")
+
+    monkeypatch.setattr(artifact_service_module, "open", blocking_open, raising=False)
+    mock_artifact_repo.get_max_version.return_value = 0
+    mock_artifact_repo.create.side_effect = _echo_artifact
+
+    # Act
+    artifact = await service.create_artifact(
+        task_id="task-123",
+        pipeline_run_id="run-1",
+        step_run_id="step-run-1",
+        artifact_type=ArtifactType.document,
+        content="Non-blocking content",
     )
 
-    # Create a test file
+    # Assert
+    assert Path(artifact.content["url"]).read_text(encoding="utf-8") == "Non-blocking content"
+
+
+@pytest.mark.asyncio
+async def test_read_content_success(service, temp_storage):
+    """Test reading artifact content from filesystem"""
+    # Arrange - create a test file
     task_id = "task-123"
     task_dir = Path(temp_storage) / task_id
     task_dir.mkdir(parents=True)
@@ -254,14 +300,8 @@ async def test_read_content_success(mock_artifact_repo, temp_storage):
     assert read_content == content
 
 
-def test_read_content_file_not_found(mock_artifact_repo, temp_storage):
+def test_read_content_file_not_found(service):
     """Test reading non-existent artifact raises FileNotFoundError"""
-    # Arrange
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=temp_storage,
-    )
-
     # Act & Assert
     with pytest.raises(FileNotFoundError) as exc_info:
         service.read_content("artifacts/task-999/non-existent.txt")
@@ -270,50 +310,12 @@ def test_read_content_file_not_found(mock_artifact_repo, temp_storage):
 
 
 @pytest.mark.asyncio
-async def test_artifact_content_url_format(mock_artifact_repo, temp_storage):
-    """Test that content_url has correct format"""
-    # Arrange
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=temp_storage,
-    )
-
-    mock_artifact_repo.get_max_version.return_value = 0
-
-    async def create_mock(artifact):
-        return artifact
-
-    mock_artifact_repo.create.side_effect = create_mock
-
-    # Act
-    artifact = await service.create_artifact(
-        task_id="task-123",
-        pipeline_run_id="run-1",
-        step_run_id="step-run-1",
-        artifact_type=ArtifactType.document,
-        content="Test content",
-    )
-
-    # Assert content_url format - content_url is in the content dict
-    assert "task-123" in artifact.content["url"]
-    assert "document_v1.txt" in artifact.content["url"]
-
-
-@pytest.mark.asyncio
-async def test_artifact_metadata_storage(mock_artifact_repo, temp_storage):
+async def test_artifact_metadata_storage(service, mock_artifact_repo):
     """Test that artifact metadata is properly stored"""
     # Arrange
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=temp_storage,
-    )
-
     mock_artifact_repo.get_max_version.return_value = 0
 
-    async def create_mock(artifact):
-        return artifact
-
-    mock_artifact_repo.create.side_effect = create_mock
+    mock_artifact_repo.create.side_effect = _echo_artifact
 
     metadata = {
         "step_name": "generate_prd",
@@ -337,43 +339,18 @@ async def test_artifact_metadata_storage(mock_artifact_repo, temp_storage):
 
 
 @pytest.mark.asyncio
-async def test_artifact_service_creates_storage_root(mock_artifact_repo, temp_storage):
-    """Test that ArtifactService creates storage root directory if it doesn't exist"""
-    # Arrange
-    storage_path = Path(temp_storage) / "new_artifacts_dir"
-    assert not storage_path.exists()
-
-    # Act
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=str(storage_path),
-    )
-
-    # Assert
-    assert storage_path.exists()
-    assert storage_path.is_dir()
-
-
-@pytest.mark.asyncio
-async def test_concurrent_artifact_creation_versioning(mock_artifact_repo, temp_storage):
+async def test_concurrent_artifact_creation_versioning(service, mock_artifact_repo):
     """Test that concurrent artifact creation with same task/type gets correct versions"""
     # Arrange
-    service = ArtifactService(
-        artifact_repo=mock_artifact_repo,
-        storage_root=temp_storage,
-    )
-
-    async def create_mock(artifact):
-        return artifact
-
-    mock_artifact_repo.create.side_effect = create_mock
+    mock_artifact_repo.create.side_effect = _echo_artifact
 
-    # Simulate concurrent calls with different max versions
-    mock_artifact_repo.get_max_version.side_effect = [0, 1, 2]  # Sequential versions
+    # Simulate concurrent calls with different max versions (0, 1, 2, ...)
+    max_versions = itertools.count(0)
+    mock_artifact_repo.get_max_version.side_effect = lambda *args, **kwargs: next(max_versions)
 
     # Act
     artifacts = []
-    for i in range(3):
+    for i in range(CONCURRENT_CREATIONS):
         artifact = await service.create_artifact(
             task_id="task-123",
             pipeline_run_id=f"run-{i+1}",
@@ -384,9 +361,7 @@ async def test_concurrent_artifact_creation_versioning(mock_artifact_repo, temp_
         artifacts.append(artifact)
 
     # Assert
-    assert artifacts[0].version == 1
-    assert artifacts[1].version == 2
-    assert artifacts[2].version == 3
+    assert [a.version for a in artifacts] == list(range(1, CONCURRENT_CREATIONS + 1))
 
     # Verify get_max_version was called for each creation
-    assert mock_artifact_repo.get_max_version.call_count == 3
+    assert mock_artifact_repo.get_max_version.call_count == CONCURRENT_CREATIONS
@@ -1,6 +1,8 @@
+import asyncio
 import pytest
+from collections import namedtuple
+from types import MappingProxyType
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
 from src.app.services.pipeline_executor import PipelineExecutor
 from src.domain import Task, PipelineRun, PipelineStep
 from src.domain.enums import (
@@ -8,37 +10,116 @@ from src.domain.enums import (
     PipelineRunStatus,
     PipelineStepStatus,
     ArtifactType,
-    StepType,
 )
+from tests.utils.stubs import FakeRepo
 
 
-@pytest.fixture
+# (id, step_number, step_name, step_type) for each of PipelineExecutor.PIPELINE_STEPS
+_STEP_SPECS = tuple(
+    (f"step-{i+1}", step_def["step_number"], step_def["step_name"], step_def["step_type"])
+    for i, step_def in enumerate(PipelineExecutor.PIPELINE_STEPS)
+)
+
+def make_steps(pipeline_run_id="run-123"):
+    """Build the pending steps matching _STEP_SPECS for a pipeline run"""
+    return [
+        PipelineStep(
+            id=step_id,
+            pipeline_run_id=pipeline_run_id,
+            step_number=step_number,
+            step_name=step_name,
+            step_type=step_type,
+            status=PipelineStepStatus.pending,
+        )
+        for step_id, step_number, step_name, step_type in _STEP_SPECS
+    ]
+
+
+def _wire_step_creation(step_repo):
+    """Make step_repo.create return freshly built steps, in order"""
+    step_repo.create.side_effect = make_steps()
+
+
+def _expecting(*keys, output):
+    """Step handler that asserts ``keys`` are already in the context, then returns ``output``"""
+    expected = frozenset(keys)
+
+    async def handler(context, tenant_id):
+        missing = expected - context.keys()
+        assert not missing, missing
+        return output
+
+    return handler
+
+
+@pytest.fixture(scope="module")
 def mock_task_repo():
-    return AsyncMock()
+    return FakeRepo("update")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_pipeline_run_repo():
-    return AsyncMock()
+    return FakeRepo("create", "update", "get_by_id")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_pipeline_step_repo():
-    return AsyncMock()
+    return FakeRepo("create", "update")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_audit_service():
-    return AsyncMock()
+    return FakeRepo("log_event")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_artifact_service():
-    return AsyncMock()
+    return FakeRepo("create_artifact")
 
 
-@pytest.fixture
-async def success_step_handler():
+@pytest.fixture(autouse=True)
+def _reset_mocks(
+    mock_task_repo,
+    mock_pipeline_run_repo,
+    mock_pipeline_step_repo,
+    mock_audit_service,
+    mock_artifact_service,
+):
+    """Module-scoped stubs are shared - clear calls, return values and side effects per test"""
+    for mock in (
+        mock_task_repo,
+        mock_pipeline_run_repo,
+        mock_pipeline_step_repo,
+        mock_audit_service,
+        mock_artifact_service,
+    ):
+        mock.reset()
+
+
+@pytest.fixture(scope="module")
+def executor_factory(
+    mock_task_repo,
+    mock_pipeline_run_repo,
+    mock_pipeline_step_repo,
+    mock_audit_service,
+):
+    """Build a PipelineExecutor over the shared stubs for the given step handlers"""
+
+    def make(step_handlers, artifact_service=None):
+        return PipelineExecutor(
+            task_repo=mock_task_repo,
+            pipeline_run_repo=mock_pipeline_run_repo,
+            pipeline_step_repo=mock_pipeline_step_repo,
+            audit_service=mock_audit_service,
+            step_handlers=step_handlers,
+            artifact_service=artifact_service,
+        )
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def success_step_handler():
     """Handler that always succeeds"""
 
     async def handler(context, tenant_id):
@@ -47,8 +128,8 @@ async def success_step_handler():
     return handler
 
 
-@pytest.fixture
-async def failing_step_handler():
+@pytest.fixture(scope="module")
+def failing_step_handler():
     """Handler that always fails"""
 
     async def handler(context, tenant_id):
@@ -57,10 +138,18 @@ async def failing_step_handler():
     return handler
 
 
-@pytest.fixture
-def queued_task():
-    """Create a task in queued status"""
-    task = Task(
+@pytest.fixture(scope="module")
+def happy_handlers(success_step_handler):
+    """Read-only map of every pipeline step to the always-succeeding handler"""
+    return MappingProxyType(
+        {step_name: success_step_handler for _, _, step_name, _ in _STEP_SPECS}
+    )
+
+
+@pytest.fixture(scope="module")
+def queued_task_template():
+    """Task in queued status, built once per module"""
+    return Task(
         id="task-123",
         tenant_id="tenant-123",
         project_id="project-123",
@@ -68,140 +157,140 @@ def queued_task():
         input_spec={"requirement": "Build something"},
         status=TaskStatus.queued,
     )
-    return task
 
 
-@pytest.mark.asyncio
-async def test_execute_pipeline_success(
-    queued_task,
-    mock_task_repo,
-    mock_pipeline_run_repo,
-    mock_pipeline_step_repo,
-    mock_audit_service,
-    success_step_handler,
-):
-    """Test successful pipeline execution with all steps completing"""
-    # Arrange
-    step_handlers = {
-        "validate_input": success_step_handler,
-        "generate_prd": success_step_handler,
-        "generate_stories": success_step_handler,
-        "review_output": success_step_handler,
-    }
+@pytest.fixture
+def queued_task(queued_task_template):
+    """Create a task in queued status (a copy - execute() transitions its status)"""
+    return queued_task_template.model_copy()
 
-    # Mock pipeline run creation
-    mock_pipeline_run = PipelineRun(
+
+@pytest.fixture(scope="module")
+def pipeline_run_template(queued_task_template):
+    """Running pipeline run for the queued task, built once per module"""
+    return PipelineRun(
         id="run-123",
-        task_id=queued_task.id,
-        tenant_id=queued_task.tenant_id,
+        task_id=queued_task_template.id,
+        tenant_id=queued_task_template.tenant_id,
         status=PipelineRunStatus.running,
     )
-    mock_pipeline_run_repo.create.return_value = mock_pipeline_run
 
-    # Mock pipeline step creation
-    created_steps = []
-    for i, step_def in enumerate(PipelineExecutor.PIPELINE_STEPS):
-        step = PipelineStep(
-            id=f"step-{i+1}",
-            pipeline_run_id=mock_pipeline_run.id,
-            step_number=step_def["step_number"],
-            step_name=step_def["step_name"],
-            step_type=step_def["step_type"],
-            status=PipelineStepStatus.pending,
-        )
-        created_steps.append(step)
 
-    mock_pipeline_step_repo.create.side_effect = created_steps
+@pytest.fixture
+def mock_pipeline_run(pipeline_run_template):
+    """Pipeline run returned by the run repo (a copy - execute() marks it completed/failed)"""
+    return pipeline_run_template.model_copy()
+
+
+HappyPathExecution = namedtuple(
+    "HappyPathExecution",
+    [
+        "task_repo",
+        "pipeline_run_repo",
+        "pipeline_step_repo",
+        "audit_service",
+        "task_statuses",
+        "step_statuses",
+        "audit_event_types",
+    ],
+)
+
+
+@pytest.fixture(scope="module")
+def happy_path_execution(queued_task_template, pipeline_run_template, happy_handlers):
+    """Run the all-steps-succeed pipeline once per module and record its side effects
+
+    Uses private stubs (not the shared, per-test-reset ones) so the recorded
+    calls survive for every test that asserts on them.
+    """
+    task_repo = FakeRepo("update")
+    pipeline_run_repo = FakeRepo("create", "update", "get_by_id")
+    pipeline_step_repo = FakeRepo("create", "update")
+    audit_service = FakeRepo("log_event")
+
+    pipeline_run_repo.create.return_value = pipeline_run_template.model_copy()
+    _wire_step_creation(pipeline_step_repo)
+
+    # Capture task/step status at the time of each update
+    task_statuses = []
+    step_statuses = []
+    audit_event_types = []
+    task_repo.update.side_effect = lambda task: task_statuses.append(task.status)
+    pipeline_step_repo.update.side_effect = lambda step: step_statuses.append(step.status)
+    audit_service.log_event.side_effect = (
+        lambda **event: audit_event_types.append(event["event_type"])
+    )
 
     executor = PipelineExecutor(
-        task_repo=mock_task_repo,
-        pipeline_run_repo=mock_pipeline_run_repo,
-        pipeline_step_repo=mock_pipeline_step_repo,
-        audit_service=mock_audit_service,
-        step_handlers=step_handlers,
+        task_repo=task_repo,
+        pipeline_run_repo=pipeline_run_repo,
+        pipeline_step_repo=pipeline_step_repo,
+        audit_service=audit_service,
+        step_handlers=happy_handlers,
+    )
+    asyncio.run(executor.execute(queued_task_template.model_copy()))
+
+    return HappyPathExecution(
+        task_repo=task_repo,
+        pipeline_run_repo=pipeline_run_repo,
+        pipeline_step_repo=pipeline_step_repo,
+        audit_service=audit_service,
+        task_statuses=tuple(task_statuses),
+        step_statuses=tuple(step_statuses),
+        audit_event_types=tuple(audit_event_types),
     )
 
-    # Act
-    await executor.execute(queued_task)
 
-    # Assert
+def test_execute_pipeline_success(happy_path_execution):
+    """Test successful pipeline execution with all steps completing"""
+    execution = happy_path_execution
+
     # Verify task was updated to running then completed
-    assert mock_task_repo.update.call_count >= 2
-    final_task_update = mock_task_repo.update.call_args_list[-1][0][0]
-    assert final_task_update.status == TaskStatus.completed
+    assert execution.task_repo.update.call_count >= 2
+    assert execution.task_statuses[-1] == TaskStatus.completed
 
     # Verify pipeline run was created and completed
-    mock_pipeline_run_repo.create.assert_called_once()
-    mock_pipeline_run_repo.update.assert_called_once()
+    assert execution.pipeline_run_repo.create.call_count == 1
+    assert execution.pipeline_run_repo.update.call_count == 1
 
     # Verify all 4 steps were created
-    assert mock_pipeline_step_repo.create.call_count == 4
+    assert execution.pipeline_step_repo.create.call_count == 4
 
     # Verify all 4 steps were updated (pending → running → completed)
-    assert mock_pipeline_step_repo.update.call_count == 8  # 2 updates per step
+    assert execution.pipeline_step_repo.update.call_count == 8  # 2 updates per step
 
     # Verify audit events
-    assert mock_audit_service.log_event.call_count == 2  # pipeline_started, pipeline_completed
-
-    # Check pipeline_started event
-    started_call = mock_audit_service.log_event.call_args_list[0]
-    assert started_call[1]["event_type"] == "pipeline_started"
+    assert execution.audit_event_types == ("pipeline_started", "pipeline_completed")
 
-    # Check pipeline_completed event
-    completed_call = mock_audit_service.log_event.call_args_list[1]
-    assert completed_call[1]["event_type"] == "pipeline_completed"
 
-
-@pytest.mark.asyncio
 async def test_execute_pipeline_step_failure(
     queued_task,
+    mock_pipeline_run,
     mock_task_repo,
     mock_pipeline_run_repo,
     mock_pipeline_step_repo,
     mock_audit_service,
-    success_step_handler,
+    happy_handlers,
     failing_step_handler,
+    executor_factory,
 ):
     """Test pipeline execution when a step fails"""
     # Arrange - step 2 fails
-    step_handlers = {
-        "validate_input": success_step_handler,
-        "generate_prd": failing_step_handler,  # This will fail
-        "generate_stories": success_step_handler,
-        "review_output": success_step_handler,
-    }
+    step_handlers = {**happy_handlers, "generate_prd": failing_step_handler}
 
-    mock_pipeline_run = PipelineRun(
-        id="run-123",
-        task_id=queued_task.id,
-        tenant_id=queued_task.tenant_id,
-        status=PipelineRunStatus.running,
-    )
     mock_pipeline_run_repo.create.return_value = mock_pipeline_run
 
-    # Mock step creation
-    created_steps = []
-    for i, step_def in enumerate(PipelineExecutor.PIPELINE_STEPS):
-        step = PipelineStep(
-            id=f"step-{i+1}",
-            pipeline_run_id=mock_pipeline_run.id,
-            step_number=step_def["step_number"],
-            step_name=step_def["step_name"],
-            step_type=step_def["step_type"],
-            status=PipelineStepStatus.pending,
-        )
-        created_steps.append(step)
-
-    mock_pipeline_step_repo.create.side_effect = created_steps
+    _wire_step_creation(mock_pipeline_step_repo)
 
-    executor = PipelineExecutor(
-        task_repo=mock_task_repo,
-        pipeline_run_repo=mock_pipeline_run_repo,
-        pipeline_step_repo=mock_pipeline_step_repo,
-        audit_service=mock_audit_service,
-        step_handlers=step_handlers,
+    updated_tasks = []
+    audit_event_types = []
+    mock_task_repo.update.side_effect = updated_tasks.append
+    mock_audit_service.log_event.side_effect = (
+        lambda **event: audit_event_types.append(event["event_type"])
     )
 
+    executor = executor_factory(step_handlers)
+
     # Act & Assert
     with pytest.raises(Exception) as exc_info:
         await executor.execute(queued_task)
@@ -209,94 +298,64 @@ async def test_execute_pipeline_step_failure(
     assert "generate_prd failed" in str(exc_info.value)
 
     # Verify task was marked as failed
-    final_task_update = mock_task_repo.update.call_args_list[-1][0][0]
-    assert final_task_update.status == TaskStatus.failed
+    assert updated_tasks[-1].status == TaskStatus.failed
 
     # Verify pipeline run was marked as failed
     assert mock_pipeline_run_repo.update.call_count >= 1
 
     # Verify pipeline_failed audit event
-    failed_calls = [
-        call for call in mock_audit_service.log_event.call_args_list
-        if call[1]["event_type"] == "pipeline_failed"
-    ]
-    assert len(failed_calls) == 1
+    assert audit_event_types.count("pipeline_failed") == 1
 
 
-@pytest.mark.asyncio
-async def test_execute_pipeline_invalid_task_status(
-    mock_task_repo,
-    mock_pipeline_run_repo,
-    mock_pipeline_step_repo,
-    mock_audit_service,
-):
-    """Test that pipeline execution fails if task is not in queued status"""
+def test_execute_pipeline_invalid_task_status(queued_task_template):
+    """Test that pipeline execution fails if task is not in queued status
+
+    The status check runs before the first await, so this is a plain sync test
+    and only the run repo - the one it asserts on - needs to be a stub.
+    """
     # Arrange
-    task = Task(
-        id="task-123",
-        tenant_id="tenant-123",
-        project_id="project-123",
-        title="Test Task",
-        input_spec={"requirement": "Test"},
-        status=TaskStatus.draft,  # Wrong status!
-    )
+    task = queued_task_template.model_copy(update={"status": TaskStatus.draft})  # Wrong status!
 
+    pipeline_run_repo = FakeRepo("create")
     executor = PipelineExecutor(
-        task_repo=mock_task_repo,
-        pipeline_run_repo=mock_pipeline_run_repo,
-        pipeline_step_repo=mock_pipeline_step_repo,
-        audit_service=mock_audit_service,
+        task_repo=None,
+        pipeline_run_repo=pipeline_run_repo,
+        pipeline_step_repo=None,
+        audit_service=None,
         step_handlers={},
     )
 
     # Act & Assert
     with pytest.raises(ValueError) as exc_info:
-        await executor.execute(task)
+        asyncio.run(executor.execute(task))
 
     assert "must be in 'queued' status" in str(exc_info.value)
 
     # Verify no pipeline run was created
-    mock_pipeline_run_repo.create.assert_not_called()
+    assert pipeline_run_repo.create.call_count == 0
 
 
-@pytest.mark.asyncio
 async def test_execute_step_no_handler(
     queued_task,
+    mock_pipeline_run,
     mock_task_repo,
     mock_pipeline_run_repo,
     mock_pipeline_step_repo,
-    mock_audit_service,
+    executor_factory,
 ):
     """Test that execution fails if a step handler is missing"""
     # Arrange - no handlers provided
     step_handlers = {}  # Missing all handlers!
 
-    mock_pipeline_run = PipelineRun(
-        id="run-123",
-        task_id=queued_task.id,
-        tenant_id=queued_task.tenant_id,
-        status=PipelineRunStatus.running,
-    )
     mock_pipeline_run_repo.create.return_value = mock_pipeline_run
 
     # Mock step creation
-    step = PipelineStep(
-        id="step-1",
-        pipeline_run_id=mock_pipeline_run.id,
-        step_number=1,
-        step_name="validate_input",
-        step_type=StepType.ANALYSIS,
-        status=PipelineStepStatus.pending,
-    )
-    mock_pipeline_step_repo.create.return_value = step
+    mock_pipeline_step_repo.create.return_value = make_steps(mock_pipeline_run.id)[0]
 
-    executor = PipelineExecutor(
-        task_repo=mock_task_repo,
-        pipeline_run_repo=mock_pipeline_run_repo,
-        pipeline_step_repo=mock_pipeline_step_repo,
-        audit_service=mock_audit_service,
-        step_handlers=step_handlers,
-    )
+    updated_tasks = []
+    mock_task_repo.update.side_effect = updated_tasks.append
+
+    executor = executor_factory(step_handlers)
 
     # Act & Assert
     with pytest.raises(Exception) as exc_info:
@@ -305,70 +364,13 @@ async def test_execute_step_no_handler(
     assert "No handler found for step" in str(exc_info.value)
 
     # Verify task was marked as failed
-    final_task_update = mock_task_repo.update.call_args_list[-1][0][0]
-    assert final_task_update.status == TaskStatus.failed
+    assert updated_tasks[-1].status == TaskStatus.failed
 
 
-@pytest.mark.asyncio
-async def test_pipeline_task_state_transitions(
-    queued_task,
-    mock_task_repo,
-    mock_pipeline_run_repo,
-    mock_pipeline_step_repo,
-    mock_audit_service,
-    success_step_handler,
-):
+def test_pipeline_task_state_transitions(happy_path_execution):
     """Test that task transitions correctly: queued → running → completed"""
-    # Arrange
-    step_handlers = {
-        "validate_input": success_step_handler,
-        "generate_prd": success_step_handler,
-        "generate_stories": success_step_handler,
-        "review_output": success_step_handler,
-    }
-
-    mock_pipeline_run = PipelineRun(
-        id="run-123",
-        task_id=queued_task.id,
-        tenant_id=queued_task.tenant_id,
-    )
-    mock_pipeline_run_repo.create.return_value = mock_pipeline_run
-
-    # Mock step creation
-    created_steps = []
-    for i, step_def in enumerate(PipelineExecutor.PIPELINE_STEPS):
-        step = PipelineStep(
-            id=f"step-{i+1}",
-            pipeline_run_id=mock_pipeline_run.id,
-            step_number=step_def["step_number"],
-            step_name=step_def["step_name"],
-            step_type=step_def["step_type"],
-            status=PipelineStepStatus.pending,
-        )
-        created_steps.append(step)
-
-    mock_pipeline_step_repo.create.side_effect = created_steps
-
-    # Capture task status at time of each update
-    captured_statuses = []
-
-    async def capture_task_status(task):
-        captured_statuses.append(task.status)
-
-    mock_task_repo.update.side_effect = capture_task_status
-
-    executor = PipelineExecutor(
-        task_repo=mock_task_repo,
-        pipeline_run_repo=mock_pipeline_run_repo,
-        pipeline_step_repo=mock_pipeline_step_repo,
-        audit_service=mock_audit_service,
-        step_handlers=step_handlers,
-    )
-
-    # Act
-    await executor.execute(queued_task)
+    captured_statuses = happy_path_execution.task_statuses
 
-    # Assert task state transitions
     # First update: queued → running
     assert captured_statuses[0] == TaskStatus.running
 
@@ -376,149 +378,51 @@ async def test_pipeline_task_state_transitions(
     assert captured_statuses[-1] == TaskStatus.completed
 
 
-@pytest.mark.asyncio
-async def test_pipeline_step_state_transitions(
-    queued_task,
-    mock_task_repo,
-    mock_pipeline_run_repo,
-    mock_pipeline_step_repo,
-    mock_audit_service,
-    success_step_handler,
-):
+def test_pipeline_step_state_transitions(happy_path_execution):
     """Test that steps transition correctly: pending → running → completed"""
-    # Arrange
-    step_handlers = {
-        "validate_input": success_step_handler,
-        "generate_prd": success_step_handler,
-        "generate_stories": success_step_handler,
-        "review_output": success_step_handler,
-    }
+    captured_step_statuses = happy_path_execution.step_statuses
 
-    mock_pipeline_run = PipelineRun(
-        id="run-123",
-        task_id=queued_task.id,
-        tenant_id=queued_task.tenant_id,
-    )
-    mock_pipeline_run_repo.create.return_value = mock_pipeline_run
+    # Each of the 4 steps is updated twice: pending → running, running → completed
+    assert captured_step_statuses == (
+        PipelineStepStatus.running,
+        PipelineStepStatus.completed,
+    ) * 4
 
-    # Mock step creation
-    created_steps = []
-    for i, step_def in enumerate(PipelineExecutor.PIPELINE_STEPS):
-        step = PipelineStep(
-            id=f"step-{i+1}",
-            pipeline_run_id=mock_pipeline_run.id,
-            step_number=step_def["step_number"],
-            step_name=step_def["step_name"],
-            step_type=step_def["step_type"],
-            status=PipelineStepStatus.pending,
-        )
-        created_steps.append(step)
-
-    mock_pipeline_step_repo.create.side_effect = created_steps
-
-    # Capture step status at time of each update
-    captured_step_statuses = []
-
-    async def capture_step_status(step):
-        captured_step_statuses.append(step.status)
 
-    mock_pipeline_step_repo.update.side_effect = capture_step_status
-
-    executor = PipelineExecutor(
-        task_repo=mock_task_repo,
-        pipeline_run_repo=mock_pipeline_run_repo,
-        pipeline_step_repo=mock_pipeline_step_repo,
-        audit_service=mock_audit_service,
-        step_handlers=step_handlers,
-    )
-
-    # Act
-    await executor.execute(queued_task)
-
-    # Assert step state transitions
-    # Each step should have 2 updates: pending → running, running → completed
-    # 4 steps * 2 updates = 8 total
-    assert len(captured_step_statuses) == 8
-
-    # Check first step's transitions
-    assert captured_step_statuses[0] == PipelineStepStatus.running  # Step 1: pending → running
-    assert captured_step_statuses[1] == PipelineStepStatus.completed  # Step 1: running → completed
-
-
-@pytest.mark.asyncio
 async def test_pipeline_context_accumulation(
     queued_task,
-    mock_task_repo,
+    mock_pipeline_run,
     mock_pipeline_run_repo,
     mock_pipeline_step_repo,
-    mock_audit_service,
+    executor_factory,
 ):
     """Test that context accumulates across steps"""
     # Arrange
-    step_1_output = {"validation_passed": True}
-    step_2_output = {"prd_generated": True}
-
-    async def step_1_handler(context, tenant_id):
-        assert "input_spec" in context
-        return step_1_output
-
-    async def step_2_handler(context, tenant_id):
-        # Should have input_spec + step_1 output
-        assert "input_spec" in context
-        assert "validation_passed" in context
-        return step_2_output
-
-    async def step_3_handler(context, tenant_id):
-        # Should have all previous outputs
-        assert "input_spec" in context
-        assert "validation_passed" in context
-        assert "prd_generated" in context
-        return {"stories_generated": True}
-
-    async def step_4_handler(context, tenant_id):
-        # Should have all previous outputs
-        assert "input_spec" in context
-        assert "validation_passed" in context
-        assert "prd_generated" in context
-        assert "stories_generated" in context
-        return {"review_passed": True}
-
+    # Each step must see the task input plus every earlier step's output
     step_handlers = {
-        "validate_input": step_1_handler,
-        "generate_prd": step_2_handler,
-        "generate_stories": step_3_handler,
-        "review_output": step_4_handler,
+        "validate_input": _expecting(
+            "input_spec",
+            output={"validation_passed": True},
+        ),
+        "generate_prd": _expecting(
+            "input_spec", "validation_passed",
+            output={"prd_generated": True},
+        ),
+        "generate_stories": _expecting(
+            "input_spec", "validation_passed", "prd_generated",
+            output={"stories_generated": True},
+        ),
+        "review_output": _expecting(
+            "input_spec", "validation_passed", "prd_generated", "stories_generated",
+            output={"review_passed": True},
+        ),
     }
 
-    mock_pipeline_run = PipelineRun(
-        id="run-123",
-        task_id=queued_task.id,
-        tenant_id=queued_task.tenant_id,
-    )
     mock_pipeline_run_repo.create.return_value = mock_pipeline_run
 
-    # Mock step creation
-    created_steps = []
-    for i, step_def in enumerate(PipelineExecutor.PIPELINE_STEPS):
-        step = PipelineStep(
-            id=f"step-{i+1}",
-            pipeline_run_id=mock_pipeline_run.id,
-            step_number=step_def["step_number"],
-            step_name=step_def["step_name"],
-            step_type=step_def["step_type"],
-            status=PipelineStepStatus.pending,
-        )
-        created_steps.append(step)
-
-    mock_pipeline_step_repo.create.side_effect = created_steps
+    _wire_step_creation(mock_pipeline_step_repo)
 
-    executor = PipelineExecutor(
-        task_repo=mock_task_repo,
-        pipeline_run_repo=mock_pipeline_run_repo,
-        pipeline_step_repo=mock_pipeline_step_repo,
-        audit_service=mock_audit_service,
-        step_handlers=step_handlers,
-    )
+    executor = executor_factory(step_handlers)
 
     # Act
     await executor.execute(queued_task)
@@ -528,77 +432,68 @@ async def test_pipeline_context_accumulation(
     assert True
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "step_name,step_output,expected_artifact_type,content_needle",
+    [
+        (
+            "generate_prd",
+            {"prd_content": "PRD content here", "prd_generated": True},
+            ArtifactType.document,
+            "PRD content",
+        ),
+        (
+            "generate_stories",
+            {"stories_content": "Stories content here", "stories_generated": True},
+            ArtifactType.code,
+            "Stories content",
+        ),
+    ],
+    ids=["prd", "stories"],
+)
 async def test_pipeline_with_artifact_service(
+    step_name,
+    step_output,
+    expected_artifact_type,
+    content_needle,
     queued_task,
-    mock_task_repo,
+    mock_pipeline_run,
     mock_pipeline_run_repo,
     mock_pipeline_step_repo,
-    mock_audit_service,
     mock_artifact_service,
+    executor_factory,
 ):
-    """Test that pipeline creates artifacts when artifact service is provided"""
-    # Arrange
-    async def prd_handler(context, tenant_id):
-        return {"prd_content": "PRD content here", "prd_generated": True}
-
-    async def stories_handler(context, tenant_id):
-        return {"stories_content": "Stories content here", "stories_generated": True}
+    """Test that each artifact-producing step creates its artifact via the artifact service"""
+    # Arrange - only step_name returns artifact content
+    async def artifact_handler(context, tenant_id):
+        return step_output
 
     async def other_handler(context, tenant_id):
         return {"result": "success"}
 
-    step_handlers = {
-        "validate_input": other_handler,
-        "generate_prd": prd_handler,  # Should create artifact
-        "generate_stories": stories_handler,  # Should create artifact
-        "review_output": other_handler,
-    }
-
-    mock_pipeline_run = PipelineRun(
-        id="run-123",
-        task_id=queued_task.id,
-        tenant_id=queued_task.tenant_id,
+    step_handlers = dict.fromkeys(
+        ("validate_input", "generate_prd", "generate_stories", "review_output"),
+        other_handler,
     )
+    step_handlers[step_name] = artifact_handler
+
     mock_pipeline_run_repo.create.return_value = mock_pipeline_run
     mock_pipeline_run_repo.get_by_id.return_value = mock_pipeline_run
 
-    # Mock step creation
-    created_steps = []
-    for i, step_def in enumerate(PipelineExecutor.PIPELINE_STEPS):
-        step = PipelineStep(
-            id=f"step-{i+1}",
-            pipeline_run_id=mock_pipeline_run.id,
-            step_number=step_def["step_number"],
-            step_name=step_def["step_name"],
-            step_type=step_def["step_type"],
-            status=PipelineStepStatus.pending,
-        )
-        created_steps.append(step)
+    _wire_step_creation(mock_pipeline_step_repo)
 
-    mock_pipeline_step_repo.create.side_effect = created_steps
-
-    executor = PipelineExecutor(
-        task_repo=mock_task_repo,
-        pipeline_run_repo=mock_pipeline_run_repo,
-        pipeline_step_repo=mock_pipeline_step_repo,
-        audit_service=mock_audit_service,
-        step_handlers=step_handlers,
-        artifact_service=mock_artifact_service,
+    created_artifacts = []
+    mock_artifact_service.create_artifact.side_effect = (
+        lambda **artifact: created_artifacts.append(artifact)
     )
 
+    executor = executor_factory(step_handlers, artifact_service=mock_artifact_service)
+
     # Act
     await executor.execute(queued_task)
 
-    # Assert - artifacts should be created for step 2 and step 3
-    assert mock_artifact_service.create_artifact.call_count == 2
-
-    # Check first artifact (step 2: PRD)
-    first_call = mock_artifact_service.create_artifact.call_args_list[0]
-    assert first_call[1]["artifact_type"] == ArtifactType.document
-    assert "PRD content" in first_call[1]["content"]
-
-    # Check second artifact (step 3: Stories)
-    second_call = mock_artifact_service.create_artifact.call_args_list[1]
-    assert second_call[1]["artifact_type"] == ArtifactType.code
-    assert "Stories content" in second_call[1]["content"]
+    # Assert - exactly one artifact, from step_name
+    assert len(created_artifacts) == 1
+    artifact = created_artifacts[0]
+    assert artifact["artifact_type"] == expected_artifact_type
+    assert content_needle in artifact["content"]
+    assert artifact["metadata"]["step_name"] == step_name
@@ -0,0 +1,43 @@
+"""Shared fixtures for use case tests"""
+import pytest
+from src.domain.task import Task
+from tests.utils.stubs import FakeRepo, FakeUoW
+
+
+@pytest.fixture(scope="session")
+def sample_task():
+    """Create a sample task"""
+    return Task(
+        id="task-123",
+        project_id="project-456",
+        tenant_id="tenant-789",
+        title="Test Task",
+        input_spec={"requirement": "test"},
+    )
+
+
+@pytest.fixture(scope="module")
+def _fake_uow_skeleton():
+    """FakeUoW carrying every repository method the use case tests stub, built once per module"""
+    return FakeUoW(
+        projects=FakeRepo("get_by_id"),
+        tasks=FakeRepo("get_by_id", "find_by_project_id"),
+        artifacts=FakeRepo(
+            "get_by_id",
+            "get_by_task",
+            "get_by_task_and_type",
+            "get_latest_by_task_and_type",
+            "update",
+        ),
+        export_jobs=FakeRepo("get_by_id", "create"),
+        git_sync_jobs=FakeRepo("get_by_id"),
+        pipeline_runs=FakeRepo("get_by_id", "get_by_task_id", "update"),
+        pipeline_steps=FakeRepo("get_by_pipeline_run_id"),
+    )
+
+
+@pytest.fixture
+def fake_uow(_fake_uow_skeleton):
+    """Hand each test the module's FakeUoW with calls and return values cleared"""
+    _fake_uow_skeleton.reset()
+    return _fake_uow_skeleton
@@ -2,37 +2,16 @@
 Unit tests for ArchiveArtifactUseCase (UC-32)
 """
 import pytest
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
 from src.app.use_cases.artifacts import ArchiveArtifactUseCase
 from src.domain.artifact import Artifact
 from src.domain.enums import ArtifactType, ArtifactStatus
-from src.domain.task import Task
+from tests.utils.clock import FIXED_NOW
 
-
-@pytest.fixture
-def mock_uow():
-    """Create a mock unit of work"""
-    uow = MagicMock()
-    uow.__aenter__ = AsyncMock(return_value=uow)
-    uow.__aexit__ = AsyncMock()
-    uow.commit = AsyncMock()
-    uow.rollback = AsyncMock()
-    uow.tasks = MagicMock()
-    uow.artifacts = MagicMock()
-    return uow
-
-
-@pytest.fixture
-def sample_task():
-    """Create a sample task"""
-    return Task(
-        id="task-123",
-        project_id="project-456",
-        tenant_id="tenant-789",
-        title="Test Task",
-        input_spec={"requirement": "test"},
-    )
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="archive_artifact"),
+    pytest.mark.fast,
+]
 
 
 @pytest.fixture
@@ -46,11 +25,11 @@ def old_artifact():
         artifact_type=ArtifactType.CODE_FILES,
         status=ArtifactStatus.draft,
         version=1,
-        created_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def latest_artifact():
     """Create the latest version artifact (version 2)"""
     return Artifact(
@@ -61,11 +40,11 @@ def latest_artifact():
         artifact_type=ArtifactType.CODE_FILES,
         status=ArtifactStatus.draft,
         version=2,
-        created_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def superseded_artifact():
     """Create an already superseded artifact"""
     return Artifact(
@@ -76,20 +55,19 @@ def superseded_artifact():
         artifact_type=ArtifactType.CODE_FILES,
         status=ArtifactStatus.superseded,
         version=1,
-        created_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
     )
 
 
-@pytest.mark.asyncio
-async def test_archive_artifact_success(mock_uow, sample_task, old_artifact, latest_artifact):
+async def test_archive_artifact_success(fake_uow, sample_task, old_artifact, latest_artifact):
     """AC-1.4.1: Successfully archive an older artifact version"""
     # Arrange
-    mock_uow.artifacts.get_by_id = AsyncMock(return_value=old_artifact)
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=sample_task)
-    mock_uow.artifacts.get_latest_by_task_and_type = AsyncMock(return_value=latest_artifact)
-    mock_uow.artifacts.update = AsyncMock(return_value=old_artifact)
+    fake_uow.artifacts.get_by_id.return_value = old_artifact
+    fake_uow.tasks.get_by_id.return_value = sample_task
+    fake_uow.artifacts.get_latest_by_task_and_type.return_value = latest_artifact
+    fake_uow.artifacts.update.return_value = old_artifact
 
-    use_case = ArchiveArtifactUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = ArchiveArtifactUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("artifact-old")
@@ -100,22 +78,21 @@ async def test_archive_artifact_success(mock_uow, sample_task, old_artifact, lat
     assert result.value.status == "superseded"
 
     # Verify artifact was updated
-    mock_uow.artifacts.update.assert_called_once()
-    mock_uow.commit.assert_called_once()
+    fake_uow.artifacts.update.assert_called_once()
+    fake_uow.commit.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_archive_artifact_cannot_archive_latest(
-    mock_uow, sample_task, latest_artifact
+    fake_uow, sample_task, latest_artifact
 ):
     """AC-1.4.2: Cannot archive the latest version"""
     # Arrange
-    mock_uow.artifacts.get_by_id = AsyncMock(return_value=latest_artifact)
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=sample_task)
+    fake_uow.artifacts.get_by_id.return_value = latest_artifact
+    fake_uow.tasks.get_by_id.return_value = sample_task
     # Latest artifact is the same as the artifact being archived
-    mock_uow.artifacts.get_latest_by_task_and_type = AsyncMock(return_value=latest_artifact)
+    fake_uow.artifacts.get_latest_by_task_and_type.return_value = latest_artifact
 
-    use_case = ArchiveArtifactUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = ArchiveArtifactUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("artifact-latest")
@@ -123,58 +100,37 @@ async def test_archive_artifact_cannot_archive_latest(
     # Assert
     assert result.is_err()
     assert result.error.code == "CANNOT_ARCHIVE_LATEST"
-    mock_uow.artifacts.update.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_archive_artifact_already_archived(
-    mock_uow, sample_task, superseded_artifact, latest_artifact
+    fake_uow.artifacts.update.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "artifact_fixture,tenant_id,expected_code",
+    [
+        ("superseded_artifact", "tenant-789", "ALREADY_ARCHIVED"),
+        (None, "tenant-789", "ARTIFACT_NOT_FOUND"),
+        # Tenant isolation - artifact from other tenant returns not found
+        ("old_artifact", "different-tenant", "ARTIFACT_NOT_FOUND"),
+    ],
+    ids=["already_archived", "not_found", "tenant_isolation"],
+)
+async def test_archive_artifact_not_archivable(
+    request, fake_uow, sample_task, artifact_fixture, tenant_id, expected_code
 ):
-    """Cannot archive already superseded artifact"""
-    # Arrange
-    mock_uow.artifacts.get_by_id = AsyncMock(return_value=superseded_artifact)
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=sample_task)
-
-    use_case = ArchiveArtifactUseCase(mock_uow, tenant_id="tenant-789")
-
-    # Act
-    result = await use_case.execute("artifact-superseded")
-
-    # Assert
-    assert result.is_err()
-    assert result.error.code == "ALREADY_ARCHIVED"
-    mock_uow.artifacts.update.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_archive_artifact_not_found(mock_uow):
-    """Artifact not found returns error"""
+    """Archived, missing or other-tenant artifacts cannot be archived"""
     # Arrange
-    mock_uow.artifacts.get_by_id = AsyncMock(return_value=None)
-
-    use_case = ArchiveArtifactUseCase(mock_uow, tenant_id="tenant-789")
-
-    # Act
-    result = await use_case.execute("nonexistent-artifact")
-
-    # Assert
-    assert result.is_err()
-    assert result.error.code == "ARTIFACT_NOT_FOUND"
-
-
-@pytest.mark.asyncio
-async def test_archive_artifact_tenant_isolation(mock_uow, old_artifact):
-    """Tenant isolation - artifact from other tenant returns not found"""
-    # Arrange
-    mock_uow.artifacts.get_by_id = AsyncMock(return_value=old_artifact)
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=None)  # Task not found for this tenant
+    artifact = request.getfixturevalue(artifact_fixture) if artifact_fixture else None
+    fake_uow.artifacts.get_by_id.return_value = artifact
+    # Task not found for any tenant but its own
+    fake_uow.tasks.get_by_id.return_value = (
+        sample_task if tenant_id == sample_task.tenant_id else None
+    )
 
-    use_case = ArchiveArtifactUseCase(mock_uow, tenant_id="different-tenant")
+    use_case = ArchiveArtifactUseCase(fake_uow, tenant_id=tenant_id)
 
     # Act
-    result = await use_case.execute("artifact-old")
+    result = await use_case.execute(artifact.id if artifact else "nonexistent-artifact")
 
     # Assert
     assert result.is_err()
-    assert result.error.code == "ARTIFACT_NOT_FOUND"
-    mock_uow.artifacts.update.assert_not_called()
+    assert result.error.code == expected_code
+    fake_uow.artifacts.update.assert_not_called()
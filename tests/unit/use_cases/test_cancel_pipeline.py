@@ -1,30 +1,58 @@
 """Unit tests for CancelPipeline use case - Story 2.6"""
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from datetime import datetime
-from libs.result import Error
 from src.domain.enums import PipelineStatus, StepStatus
 from src.domain.pipeline_run import PipelineRun
 from src.domain.pipeline_step import PipelineStepRun, StepType
 from src.app.use_cases.pipeline.cancel_pipeline import CancelPipeline
 from src.app.use_cases.pipeline.dtos import CancelPipelineCommandDTO
+from tests.utils.stubs import FakeRepo, assert_kwargs
+from tests.utils.clock import FIXED_NOW
+
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="cancel_pipeline"),
+    pytest.mark.fast,
+]
+
+def make_pipeline(status=PipelineStatus.running, tenant_id="tenant_123", **fields):
+    """Build pipeline run pipeline_123 with the given status and field overrides"""
+    return PipelineRun(
+        id="pipeline_123",
+        task_id="task_123",
+        tenant_id=tenant_id,
+        status=status,
+        **fields,
+    )
+
+
+def make_step(
+    n, status=StepStatus.running, step_type=StepType.ANALYSIS, pipeline_id="pipeline_123"
+):
+    """Build step ``n`` of a pipeline run"""
+    return PipelineStepRun(
+        id=f"step_{n}",
+        pipeline_run_id=pipeline_id,
+        step_number=n,
+        step_name=f"Step {n}",
+        step_type=step_type,
+        status=status,
+        started_at=FIXED_NOW,
+    )
 
 
 @pytest.fixture
 def mock_pipeline_repo():
-    return MagicMock()
+    return FakeRepo("get_by_id", "update")
 
 
 @pytest.fixture
 def mock_step_repo():
-    return MagicMock()
+    return FakeRepo("get_by_pipeline_run_id", "update")
 
 
 @pytest.fixture
 def mock_audit_service():
-    service = MagicMock()
-    service.log_event = AsyncMock()
-    return service
+    return FakeRepo("log_event")
 
 
 @pytest.fixture
@@ -36,7 +64,6 @@ def cancel_pipeline_use_case(mock_pipeline_repo, mock_step_repo, mock_audit_serv
     )
 
 
-@pytest.mark.asyncio
 class TestCancelPipeline:
     """Test suite for CancelPipeline use case - AC-2.6.1 through AC-2.6.5"""
 
@@ -44,45 +71,19 @@ class TestCancelPipeline:
         self, cancel_pipeline_use_case, mock_pipeline_repo, mock_step_repo, mock_audit_service
     ):
         """Test AC-2.6.1: Successfully cancel a running pipeline"""
-        # Arrange
         pipeline_id = "pipeline_123"
         tenant_id = "tenant_456"
         user_id = "user_789"
 
-        pipeline = PipelineRun(
-            id=pipeline_id,
-            task_id="task_123",
-            tenant_id=tenant_id,
-            status=PipelineStatus.running,
-            current_step=2,
-        )
-
-        completed_step = PipelineStepRun(
-            id="step_1",
-            pipeline_run_id=pipeline_id,
-            step_number=1,
-            step_name="Analysis Step",
-            step_type=StepType.ANALYSIS,
-            status=StepStatus.completed,
-            started_at=datetime.utcnow(),
-        )
+        pipeline = make_pipeline(tenant_id=tenant_id, current_step=2)
 
-        running_step = PipelineStepRun(
-            id="step_2",
-            pipeline_run_id=pipeline_id,
-            step_number=2,
-            step_name="User Stories Step",
-            step_type=StepType.USER_STORIES,
-            status=StepStatus.running,
-            started_at=datetime.utcnow(),
-        )
+        completed_step = make_step(1, StepStatus.completed)
+        running_step = make_step(2, step_type=StepType.USER_STORIES)
 
-        mock_pipeline_repo.get_by_id = AsyncMock(return_value=pipeline)
-        mock_step_repo.get_by_pipeline_run_id = AsyncMock(
-            return_value=[completed_step, running_step]
-        )
-        mock_step_repo.update = AsyncMock(return_value=running_step)
-        mock_pipeline_repo.update = AsyncMock(return_value=pipeline)
+        mock_pipeline_repo.get_by_id.return_value = pipeline
+        mock_step_repo.get_by_pipeline_run_id.return_value = [completed_step, running_step]
+        mock_step_repo.update.return_value = running_step
+        mock_pipeline_repo.update.return_value = pipeline
 
         command = CancelPipelineCommandDTO(
             pipeline_run_id=pipeline_id,
@@ -91,10 +92,8 @@ class TestCancelPipeline:
             reason="User requested cancellation",
         )
 
-        # Act
         result = await cancel_pipeline_use_case.execute(command)
 
-        # Assert
         assert result.is_ok()
         dto = result.value
         assert dto.pipeline_run_id == pipeline_id
@@ -105,39 +104,34 @@ class TestCancelPipeline:
         assert "preserved" in dto.message.lower()
 
         # Verify pipeline status was updated
-        mock_pipeline_repo.update.assert_called_once()
-        updated_pipeline = mock_pipeline_repo.update.call_args[0][0]
+        assert mock_pipeline_repo.update.call_count == 1
+        updated_pipeline = mock_pipeline_repo.update.call_args.args[0]
         assert updated_pipeline.status == PipelineStatus.cancelled
 
         # Verify running step was cancelled
-        mock_step_repo.update.assert_called_once()
+        assert mock_step_repo.update.call_count == 1
 
         # Verify audit event was logged
         mock_audit_service.log_event.assert_called_once()
-        call_args = mock_audit_service.log_event.call_args
-        assert call_args.kwargs["event_type"] == "pipeline_cancelled"
-        assert call_args.kwargs["tenant_id"] == tenant_id
-        assert call_args.kwargs["user_id"] == user_id
+        assert_kwargs(
+            mock_audit_service.log_event,
+            event_type="pipeline_cancelled",
+            tenant_id=tenant_id,
+            user_id=user_id,
+        )
 
     async def test_cancel_paused_pipeline_success(
         self, cancel_pipeline_use_case, mock_pipeline_repo, mock_step_repo
     ):
         """Test AC-2.6.1: Successfully cancel a paused pipeline"""
-        # Arrange
         pipeline_id = "pipeline_123"
         tenant_id = "tenant_456"
 
-        pipeline = PipelineRun(
-            id=pipeline_id,
-            task_id="task_123",
-            tenant_id=tenant_id,
-            status=PipelineStatus.paused,
-            current_step=1,
-        )
+        pipeline = make_pipeline(PipelineStatus.paused, tenant_id=tenant_id, current_step=1)
 
-        mock_pipeline_repo.get_by_id = AsyncMock(return_value=pipeline)
-        mock_step_repo.get_by_pipeline_run_id = AsyncMock(return_value=[])
-        mock_pipeline_repo.update = AsyncMock(return_value=pipeline)
+        mock_pipeline_repo.get_by_id.return_value = pipeline
+        mock_step_repo.get_by_pipeline_run_id.return_value = []
+        mock_pipeline_repo.update.return_value = pipeline
 
         command = CancelPipelineCommandDTO(
             pipeline_run_id=pipeline_id,
@@ -145,31 +139,23 @@ class TestCancelPipeline:
             user_id="user_123",
         )
 
-        # Act
         result = await cancel_pipeline_use_case.execute(command)
 
-        # Assert
         assert result.is_ok()
         assert result.value.previous_status == "paused"
         assert result.value.new_status == "cancelled"
 
-    async def test_cannot_cancel_completed_pipeline(
-        self, cancel_pipeline_use_case, mock_pipeline_repo
+    @pytest.mark.parametrize("status", [PipelineStatus.completed, PipelineStatus.cancelled])
+    async def test_cannot_cancel_terminal_pipeline(
+        self, status, cancel_pipeline_use_case, mock_pipeline_repo
     ):
-        """Test AC-2.6.2: Cannot cancel a completed pipeline"""
-        # Arrange
+        """Test AC-2.6.2: Cannot cancel a completed or already cancelled pipeline"""
         pipeline_id = "pipeline_123"
         tenant_id = "tenant_456"
 
-        pipeline = PipelineRun(
-            id=pipeline_id,
-            task_id="task_123",
-            tenant_id=tenant_id,
-            status=PipelineStatus.completed,
-            current_step=4,
-        )
+        pipeline = make_pipeline(status, tenant_id=tenant_id, current_step=4)
 
-        mock_pipeline_repo.get_by_id = AsyncMock(return_value=pipeline)
+        mock_pipeline_repo.get_by_id.return_value = pipeline
 
         command = CancelPipelineCommandDTO(
             pipeline_run_id=pipeline_id,
@@ -177,55 +163,21 @@ class TestCancelPipeline:
             user_id="user_123",
         )
 
-        # Act
         result = await cancel_pipeline_use_case.execute(command)
 
-        # Assert
         assert result.is_err()
         error = result.error
         assert error.code == "CANNOT_CANCEL_COMPLETED"
-        assert "completed" in error.message.lower()
+        assert status.value in error.message.lower()
 
         # Verify no updates were made
-        mock_pipeline_repo.update.assert_not_called()
-
-    async def test_cannot_cancel_already_cancelled_pipeline(
-        self, cancel_pipeline_use_case, mock_pipeline_repo
-    ):
-        """Test AC-2.6.2: Cannot cancel an already cancelled pipeline"""
-        # Arrange
-        pipeline_id = "pipeline_123"
-        tenant_id = "tenant_456"
-
-        pipeline = PipelineRun(
-            id=pipeline_id,
-            task_id="task_123",
-            tenant_id=tenant_id,
-            status=PipelineStatus.cancelled,
-            current_step=2,
-        )
-
-        mock_pipeline_repo.get_by_id = AsyncMock(return_value=pipeline)
-
-        command = CancelPipelineCommandDTO(
-            pipeline_run_id=pipeline_id,
-            tenant_id=tenant_id,
-            user_id="user_123",
-        )
-
-        # Act
-        result = await cancel_pipeline_use_case.execute(command)
-
-        # Assert
-        assert result.is_err()
-        assert result.error.code == "CANNOT_CANCEL_COMPLETED"
+        assert mock_pipeline_repo.update.call_count == 0
 
     async def test_cancel_pipeline_not_found(
         self, cancel_pipeline_use_case, mock_pipeline_repo
     ):
         """Test error when pipeline doesn't exist"""
-        # Arrange
-        mock_pipeline_repo.get_by_id = AsyncMock(return_value=None)
+        mock_pipeline_repo.get_by_id.return_value = None
 
         command = CancelPipelineCommandDTO(
             pipeline_run_id="nonexistent",
@@ -233,10 +185,8 @@ class TestCancelPipeline:
             user_id="user_123",
         )
 
-        # Act
         result = await cancel_pipeline_use_case.execute(command)
 
-        # Assert
         assert result.is_err()
         error = result.error
         assert error.code == "PIPELINE_NOT_FOUND"
@@ -245,15 +195,9 @@ class TestCancelPipeline:
         self, cancel_pipeline_use_case, mock_pipeline_repo
     ):
         """Test cancellation by wrong tenant is rejected"""
-        # Arrange
-        pipeline = PipelineRun(
-            id="pipeline_123",
-            task_id="task_123",
-            tenant_id="tenant_correct",
-            status=PipelineStatus.running,
-        )
+        pipeline = make_pipeline(tenant_id="tenant_correct")
 
-        mock_pipeline_repo.get_by_id = AsyncMock(return_value=pipeline)
+        mock_pipeline_repo.get_by_id.return_value = pipeline
 
         command = CancelPipelineCommandDTO(
             pipeline_run_id="pipeline_123",
@@ -261,69 +205,31 @@ class TestCancelPipeline:
             user_id="user_123",
         )
 
-        # Act
         result = await cancel_pipeline_use_case.execute(command)
 
-        # Assert
         assert result.is_err()
         error = result.error
         assert error.code == "UNAUTHORIZED"
         assert "not authorized" in error.message.lower()
 
         # Verify no updates were made
-        mock_pipeline_repo.update.assert_not_called()
+        assert mock_pipeline_repo.update.call_count == 0
 
     async def test_preserve_completed_steps(
         self, cancel_pipeline_use_case, mock_pipeline_repo, mock_step_repo
     ):
         """Test AC-2.6.3: Completed steps are preserved when pipeline is cancelled"""
-        # Arrange
         pipeline_id = "pipeline_123"
 
-        pipeline = PipelineRun(
-            id=pipeline_id,
-            task_id="task_123",
-            tenant_id="tenant_123",
-            status=PipelineStatus.running,
-            current_step=3,
-        )
-
-        step1 = PipelineStepRun(
-            id="step_1",
-            pipeline_run_id=pipeline_id,
-            step_number=1,
-            step_name="Step 1",
-            step_type=StepType.ANALYSIS,
-            status=StepStatus.completed,
-            started_at=datetime.utcnow(),
-        )
-
-        step2 = PipelineStepRun(
-            id="step_2",
-            pipeline_run_id=pipeline_id,
-            step_number=2,
-            step_name="Step 2",
-            step_type=StepType.USER_STORIES,
-            status=StepStatus.completed,
-            started_at=datetime.utcnow(),
-        )
-
-        step3 = PipelineStepRun(
-            id="step_3",
-            pipeline_run_id=pipeline_id,
-            step_number=3,
-            step_name="Step 3",
-            step_type=StepType.CODE_SKELETON,
-            status=StepStatus.running,
-            started_at=datetime.utcnow(),
-        )
+        pipeline = make_pipeline(current_step=3)
 
-        mock_pipeline_repo.get_by_id = AsyncMock(return_value=pipeline)
-        mock_step_repo.get_by_pipeline_run_id = AsyncMock(
-            return_value=[step1, step2, step3]
-        )
-        mock_step_repo.update = AsyncMock()
-        mock_pipeline_repo.update = AsyncMock(return_value=pipeline)
+        mock_pipeline_repo.get_by_id.return_value = pipeline
+        mock_step_repo.get_by_pipeline_run_id.return_value = [
+            make_step(1, StepStatus.completed),
+            make_step(2, StepStatus.completed, step_type=StepType.USER_STORIES),
+            make_step(3, step_type=StepType.CODE_SKELETON),
+        ]
+        mock_pipeline_repo.update.return_value = pipeline
 
         command = CancelPipelineCommandDTO(
             pipeline_run_id=pipeline_id,
@@ -331,10 +237,8 @@ class TestCancelPipeline:
             user_id="user_123",
         )
 
-        # Act
         result = await cancel_pipeline_use_case.execute(command)
 
-        # Assert
         assert result.is_ok()
         dto = result.value
         assert dto.steps_completed == 2  # Two completed steps preserved
@@ -347,23 +251,17 @@ class TestCancelPipeline:
         self, mock_pipeline_repo, mock_step_repo
     ):
         """Test cancellation works even without audit service"""
-        # Arrange
         use_case = CancelPipeline(
             pipeline_run_repository=mock_pipeline_repo,
             step_run_repository=mock_step_repo,
             audit_service=None,  # No audit service
         )
 
-        pipeline = PipelineRun(
-            id="pipeline_123",
-            task_id="task_123",
-            tenant_id="tenant_123",
-            status=PipelineStatus.running,
-        )
+        pipeline = make_pipeline()
 
-        mock_pipeline_repo.get_by_id = AsyncMock(return_value=pipeline)
-        mock_step_repo.get_by_pipeline_run_id = AsyncMock(return_value=[])
-        mock_pipeline_repo.update = AsyncMock(return_value=pipeline)
+        mock_pipeline_repo.get_by_id.return_value = pipeline
+        mock_step_repo.get_by_pipeline_run_id.return_value = []
+        mock_pipeline_repo.update.return_value = pipeline
 
         command = CancelPipelineCommandDTO(
             pipeline_run_id="pipeline_123",
@@ -371,51 +269,24 @@ class TestCancelPipeline:
             user_id="user_123",
         )
 
-        # Act
         result = await use_case.execute(command)
 
-        # Assert - should still succeed
         assert result.is_ok()
 
     async def test_multiple_running_steps_all_cancelled(
         self, cancel_pipeline_use_case, mock_pipeline_repo, mock_step_repo
     ):
         """Test AC-2.6.4: All running steps are cancelled"""
-        # Arrange
-        pipeline = PipelineRun(
-            id="pipeline_123",
-            task_id="task_123",
-            tenant_id="tenant_123",
-            status=PipelineStatus.running,
-        )
-
+        pipeline = make_pipeline()
         # Edge case: multiple running steps (shouldn't happen in normal flow)
-        running_step1 = PipelineStepRun(
-            id="step_1",
-            pipeline_run_id="pipeline_123",
-            step_number=1,
-            step_name="Step 1",
-            step_type=StepType.ANALYSIS,
-            status=StepStatus.running,
-            started_at=datetime.utcnow(),
-        )
+        steps = [
+            make_step(n, step_type=step_type)
+            for n, step_type in enumerate([StepType.ANALYSIS, StepType.USER_STORIES], 1)
+        ]
 
-        running_step2 = PipelineStepRun(
-            id="step_2",
-            pipeline_run_id="pipeline_123",
-            step_number=2,
-            step_name="Step 2",
-            step_type=StepType.USER_STORIES,
-            status=StepStatus.running,
-            started_at=datetime.utcnow(),
-        )
-
-        mock_pipeline_repo.get_by_id = AsyncMock(return_value=pipeline)
-        mock_step_repo.get_by_pipeline_run_id = AsyncMock(
-            return_value=[running_step1, running_step2]
-        )
-        mock_step_repo.update = AsyncMock()
-        mock_pipeline_repo.update = AsyncMock(return_value=pipeline)
+        mock_pipeline_repo.get_by_id.return_value = pipeline
+        mock_step_repo.get_by_pipeline_run_id.return_value = steps
+        mock_pipeline_repo.update.return_value = pipeline
 
         command = CancelPipelineCommandDTO(
             pipeline_run_id="pipeline_123",
@@ -423,10 +294,9 @@ class TestCancelPipeline:
             user_id="user_123",
         )
 
-        # Act
         result = await cancel_pipeline_use_case.execute(command)
 
-        # Assert
         assert result.is_ok()
         # Both running steps should be updated
         assert mock_step_repo.update.call_count == 2
+        assert all(step.status == StepStatus.cancelled for step in steps)
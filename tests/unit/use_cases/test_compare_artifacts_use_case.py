@@ -1,16 +1,21 @@
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock
 from src.app.use_cases.artifacts import CompareArtifactsUseCase
 from src.domain.artifact import Artifact
 from src.domain.task import Task
 from src.domain.enums import ArtifactType, TaskStatus
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="compare_artifacts"),
+    pytest.mark.fast,
+]
 
-@pytest.mark.asyncio
-async def test_compare_artifacts_success_multiple_versions(mock_uow):
+_VALID_ARTIFACT_TYPES = ("document", "code")
+
+
+async def test_compare_artifacts_success_multiple_versions(fake_uow):
     """Test successful comparison of multiple artifact versions"""
-    # Arrange
     tenant_id = "tenant-123"
     task_id = "task-456"
     artifact_type = "document"
@@ -24,7 +29,7 @@ async def test_compare_artifacts_success_multiple_versions(mock_uow):
         input_spec={"requirement": "Test"},
         status=TaskStatus.completed,
     )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
+    fake_uow.tasks.get_by_id.return_value = mock_task
 
     # Mock artifacts (3 versions)
     mock_artifacts = [
@@ -71,14 +76,12 @@ async def test_compare_artifacts_success_multiple_versions(mock_uow):
             created_at=datetime(2025, 1, 1, 12, 0, 0),
         ),
     ]
-    mock_uow.artifacts.get_by_task_and_type = AsyncMock(return_value=mock_artifacts)
+    fake_uow.artifacts.get_by_task_and_type.return_value = mock_artifacts
 
-    use_case = CompareArtifactsUseCase(uow=mock_uow, tenant_id=tenant_id)
+    use_case = CompareArtifactsUseCase(uow=fake_uow, tenant_id=tenant_id)
 
-    # Act
     result = await use_case.execute(task_id, artifact_type)
 
-    # Assert
     assert result.is_ok()
     response = result.value
     assert response.task_id == task_id
@@ -96,16 +99,14 @@ async def test_compare_artifacts_success_multiple_versions(mock_uow):
     assert response.versions[0].step_run_id == "step-run-1"
 
     # Verify repository calls
-    mock_uow.tasks.get_by_id.assert_called_once_with(task_id, tenant_id)
-    mock_uow.artifacts.get_by_task_and_type.assert_called_once_with(
+    fake_uow.tasks.get_by_id.assert_called_once_with(task_id, tenant_id)
+    fake_uow.artifacts.get_by_task_and_type.assert_called_once_with(
         task_id, ArtifactType.document
     )
 
 
-@pytest.mark.asyncio
-async def test_compare_artifacts_success_empty_list(mock_uow):
+async def test_compare_artifacts_success_empty_list(fake_uow):
     """Test successful comparison with no artifacts (returns empty list)"""
-    # Arrange
     tenant_id = "tenant-123"
     task_id = "task-456"
     artifact_type = "code"
@@ -119,17 +120,15 @@ async def test_compare_artifacts_success_empty_list(mock_uow):
         input_spec={"requirement": "Test"},
         status=TaskStatus.draft,
     )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
+    fake_uow.tasks.get_by_id.return_value = mock_task
 
     # No artifacts
-    mock_uow.artifacts.get_by_task_and_type = AsyncMock(return_value=[])
+    fake_uow.artifacts.get_by_task_and_type.return_value = []
 
-    use_case = CompareArtifactsUseCase(uow=mock_uow, tenant_id=tenant_id)
+    use_case = CompareArtifactsUseCase(uow=fake_uow, tenant_id=tenant_id)
 
-    # Act
     result = await use_case.execute(task_id, artifact_type)
 
-    # Assert
     assert result.is_ok()
     response = result.value
     assert response.task_id == task_id
@@ -137,31 +136,25 @@ async def test_compare_artifacts_success_empty_list(mock_uow):
     assert len(response.versions) == 0
 
 
-@pytest.mark.asyncio
-async def test_compare_artifacts_task_not_found(mock_uow):
+async def test_compare_artifacts_task_not_found(fake_uow):
     """Test error when task does not exist"""
-    # Arrange
     tenant_id = "tenant-123"
     task_id = "non-existent-task"
     artifact_type = "document"
 
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=None)
+    fake_uow.tasks.get_by_id.return_value = None
 
-    use_case = CompareArtifactsUseCase(uow=mock_uow, tenant_id=tenant_id)
+    use_case = CompareArtifactsUseCase(uow=fake_uow, tenant_id=tenant_id)
 
-    # Act
     result = await use_case.execute(task_id, artifact_type)
 
-    # Assert
     assert result.is_err()
     assert result.error.code == "TASK_NOT_FOUND"
     assert result.error.message == "Task not found"
 
 
-@pytest.mark.asyncio
-async def test_compare_artifacts_invalid_artifact_type(mock_uow):
+async def test_compare_artifacts_invalid_artifact_type(fake_uow):
     """Test error with invalid artifact type"""
-    # Arrange
     tenant_id = "tenant-123"
     task_id = "task-456"
     artifact_type = "invalid_type"
@@ -175,24 +168,21 @@ async def test_compare_artifacts_invalid_artifact_type(mock_uow):
         input_spec={"requirement": "Test"},
         status=TaskStatus.running,
     )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
+    fake_uow.tasks.get_by_id.return_value = mock_task
 
-    use_case = CompareArtifactsUseCase(uow=mock_uow, tenant_id=tenant_id)
+    use_case = CompareArtifactsUseCase(uow=fake_uow, tenant_id=tenant_id)
 
-    # Act
     result = await use_case.execute(task_id, artifact_type)
 
-    # Assert
     assert result.is_err()
     assert result.error.code == "INVALID_ARTIFACT_TYPE"
     assert "Invalid artifact type" in result.error.message
     assert "invalid_type" in result.error.message
 
 
-@pytest.mark.asyncio
-async def test_compare_artifacts_all_valid_types(mock_uow):
-    """Test that all valid artifact types are accepted"""
-    # Arrange
+@pytest.mark.parametrize("artifact_type", _VALID_ARTIFACT_TYPES)
+async def test_compare_artifacts_all_valid_types(fake_uow, artifact_type):
+    """Test that every valid artifact type is accepted"""
     tenant_id = "tenant-123"
     task_id = "task-456"
 
@@ -205,13 +195,12 @@ async def test_compare_artifacts_all_valid_types(mock_uow):
         input_spec={"requirement": "Test"},
         status=TaskStatus.running,
     )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
-    mock_uow.artifacts.get_by_task_and_type = AsyncMock(return_value=[])
+    fake_uow.tasks.get_by_id.return_value = mock_task
+    fake_uow.artifacts.get_by_task_and_type.return_value = []
 
-    use_case = CompareArtifactsUseCase(uow=mock_uow, tenant_id=tenant_id)
+    use_case = CompareArtifactsUseCase(uow=fake_uow, tenant_id=tenant_id)
 
-    # Act & Assert - Test all valid types
-    valid_types = ["document", "code"]
-    for artifact_type in valid_types:
-        result = await use_case.execute(task_id, artifact_type)
-        assert result.is_ok(), f"Failed for type: {artifact_type}"
+    result = await use_case.execute(task_id, artifact_type)
+
+    assert result.is_ok()
+    assert result.value.artifact_type == artifact_type
@@ -2,32 +2,22 @@
 Unit tests for CreateExportJobUseCase (UC-30)
 """
 import pytest
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
 from src.app.use_cases.exports import CreateExportJobUseCase
 from src.domain.project import Project
 from src.domain.task import Task
 from src.domain.artifact import Artifact
 from src.domain.export_job import ExportJob
 from src.domain.enums import ProjectStatus, ArtifactType, ArtifactStatus, ExportJobStatus
+from tests.utils.clock import FIXED_NOW
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="create_export_job"),
+    pytest.mark.fast,
+]
 
-@pytest.fixture
-def mock_uow():
-    """Create a mock unit of work"""
-    uow = MagicMock()
-    uow.__aenter__ = AsyncMock(return_value=uow)
-    uow.__aexit__ = AsyncMock()
-    uow.commit = AsyncMock()
-    uow.rollback = AsyncMock()
-    uow.projects = MagicMock()
-    uow.tasks = MagicMock()
-    uow.artifacts = MagicMock()
-    uow.export_jobs = MagicMock()
-    return uow
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_project():
     """Create a sample project"""
     return Project(
@@ -36,14 +26,14 @@ def sample_project():
         name="Test Project",
         description="Test Description",
         status=ProjectStatus.active,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
+        updated_at=FIXED_NOW,
     )
 
 
-@pytest.fixture
-def sample_task():
-    """Create a sample task"""
+@pytest.fixture(scope="module")
+def project_task():
+    """Create a task of the sample project"""
     return Task(
         id="task-123",
         project_id="project-123",
@@ -53,7 +43,7 @@ def sample_task():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def approved_artifact():
     """Create an approved artifact"""
     return Artifact(
@@ -65,12 +55,12 @@ def approved_artifact():
         status=ArtifactStatus.approved,
         version=1,
         content={"files": [{"filename": "test.py", "content": "print('hello')"}]},
-        created_at=datetime.utcnow(),
-        approved_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
+        approved_at=FIXED_NOW,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def draft_artifact():
     """Create a draft artifact"""
     return Artifact(
@@ -81,108 +71,88 @@ def draft_artifact():
         artifact_type=ArtifactType.CODE_FILES,
         status=ArtifactStatus.draft,
         version=1,
-        created_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
     )
 
 
-@pytest.mark.asyncio
-async def test_create_export_job_success(mock_uow, sample_project, sample_task, approved_artifact):
+async def test_create_export_job_success(fake_uow, sample_project, project_task, approved_artifact):
     """AC-3.1.1: Successfully create export job for project with approved artifacts"""
-    # Arrange
-    mock_uow.projects.get_by_id = AsyncMock(return_value=sample_project)
-    mock_uow.tasks.find_by_project_id = AsyncMock(return_value=[sample_task])
-    mock_uow.artifacts.get_by_task = AsyncMock(return_value=[approved_artifact])
+    fake_uow.projects.get_by_id.return_value = sample_project
+    fake_uow.tasks.find_by_project_id.return_value = [project_task]
+    fake_uow.artifacts.get_by_task.return_value = [approved_artifact]
 
     export_job = ExportJob(
         id="job-123",
         project_id="project-123",
         tenant_id="tenant-789",
         status=ExportJobStatus.pending,
-        created_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
     )
-    mock_uow.export_jobs.create = AsyncMock(return_value=export_job)
+    fake_uow.export_jobs.create.return_value = export_job
 
-    use_case = CreateExportJobUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = CreateExportJobUseCase(fake_uow, tenant_id="tenant-789")
 
-    # Act
     result = await use_case.execute("project-123")
 
-    # Assert
     assert result.is_ok()
     assert result.value.export_job_id == "job-123"
     assert result.value.status == "pending"
 
-    mock_uow.export_jobs.create.assert_called_once()
-    mock_uow.commit.assert_called_once()
+    assert fake_uow.export_jobs.create.call_count == 1
+    assert fake_uow.commit.call_count == 1
 
 
-@pytest.mark.asyncio
-async def test_create_export_job_project_not_found(mock_uow):
+async def test_create_export_job_project_not_found(fake_uow):
     """Project not found returns error"""
-    # Arrange
-    mock_uow.projects.get_by_id = AsyncMock(return_value=None)
+    fake_uow.projects.get_by_id.return_value = None
 
-    use_case = CreateExportJobUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = CreateExportJobUseCase(fake_uow, tenant_id="tenant-789")
 
-    # Act
     result = await use_case.execute("nonexistent-project")
 
-    # Assert
     assert result.is_err()
     assert result.error.code == "PROJECT_NOT_FOUND"
-    mock_uow.export_jobs.create.assert_not_called()
+    assert fake_uow.export_jobs.create.call_count == 0
 
 
-@pytest.mark.asyncio
-async def test_create_export_job_no_tasks(mock_uow, sample_project):
+async def test_create_export_job_no_tasks(fake_uow, sample_project):
     """No tasks in project returns error"""
-    # Arrange
-    mock_uow.projects.get_by_id = AsyncMock(return_value=sample_project)
-    mock_uow.tasks.find_by_project_id = AsyncMock(return_value=[])
+    fake_uow.projects.get_by_id.return_value = sample_project
+    fake_uow.tasks.find_by_project_id.return_value = []
 
-    use_case = CreateExportJobUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = CreateExportJobUseCase(fake_uow, tenant_id="tenant-789")
 
-    # Act
     result = await use_case.execute("project-123")
 
-    # Assert
     assert result.is_err()
     assert result.error.code == "NO_ARTIFACTS"
-    mock_uow.export_jobs.create.assert_not_called()
+    assert fake_uow.export_jobs.create.call_count == 0
 
 
-@pytest.mark.asyncio
 async def test_create_export_job_no_approved_artifacts(
-    mock_uow, sample_project, sample_task, draft_artifact
+    fake_uow, sample_project, project_task, draft_artifact
 ):
     """No approved artifacts returns error"""
-    # Arrange
-    mock_uow.projects.get_by_id = AsyncMock(return_value=sample_project)
-    mock_uow.tasks.find_by_project_id = AsyncMock(return_value=[sample_task])
-    mock_uow.artifacts.get_by_task = AsyncMock(return_value=[draft_artifact])
+    fake_uow.projects.get_by_id.return_value = sample_project
+    fake_uow.tasks.find_by_project_id.return_value = [project_task]
+    fake_uow.artifacts.get_by_task.return_value = [draft_artifact]
 
-    use_case = CreateExportJobUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = CreateExportJobUseCase(fake_uow, tenant_id="tenant-789")
 
-    # Act
     result = await use_case.execute("project-123")
 
-    # Assert
     assert result.is_err()
     assert result.error.code == "NO_APPROVED_ARTIFACTS"
-    mock_uow.export_jobs.create.assert_not_called()
+    assert fake_uow.export_jobs.create.call_count == 0
 
 
-@pytest.mark.asyncio
-async def test_create_export_job_tenant_isolation(mock_uow, sample_project):
+async def test_create_export_job_tenant_isolation(fake_uow, sample_project):
     """Tenant isolation - project from other tenant returns not found"""
-    # Arrange
-    mock_uow.projects.get_by_id = AsyncMock(return_value=None)
+    fake_uow.projects.get_by_id.return_value = None
 
-    use_case = CreateExportJobUseCase(mock_uow, tenant_id="different-tenant")
+    use_case = CreateExportJobUseCase(fake_uow, tenant_id="different-tenant")
 
-    # Act
     result = await use_case.execute("project-123")
 
-    # Assert
     assert result.is_err()
     assert result.error.code == "PROJECT_NOT_FOUND"
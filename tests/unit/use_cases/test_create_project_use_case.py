@@ -1,15 +1,30 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+import src.app.use_cases.projects.create_project_use_case as create_project_module
 from src.app.use_cases.projects import CreateProjectUseCase, CreateProjectCommand
 from src.domain import Project, ProjectStatus
+from tests.utils.stubs import FakeRepo
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="create_project"),
+    pytest.mark.fast,
+]
 
-@pytest.mark.asyncio
-async def test_create_project_success(mock_uow):
+
+@pytest.fixture
+def project_repo(monkeypatch):
+    """Stand a stub in for SqlAlchemyProjectRepository on the use case module for one test"""
+    repo = FakeRepo("create")
+    monkeypatch.setattr(
+        create_project_module, "SqlAlchemyProjectRepository", lambda *args, **kwargs: repo
+    )
+    return repo
+
+
+async def test_create_project_success(fake_uow, project_repo):
     """Test successful project creation"""
-    # Arrange
-    mock_audit_service = AsyncMock()
-    use_case = CreateProjectUseCase(mock_uow, mock_audit_service)
+    mock_audit_service = FakeRepo("log_event")
+    use_case = CreateProjectUseCase(fake_uow, mock_audit_service)
 
     command = CreateProjectCommand(
         name="Test Project",
@@ -27,47 +42,38 @@ async def test_create_project_success(mock_uow):
         status=ProjectStatus.active,
     )
 
-    # Mock the repository
-    with patch(
-        "src.app.use_cases.projects.create_project_use_case.SqlAlchemyProjectRepository"
-    ) as MockRepo:
-        mock_repo_instance = MockRepo.return_value
-        mock_repo_instance.create = AsyncMock(return_value=mock_project)
-
-        # Act
-        result = await use_case.execute(command)
-
-        # Assert
-        assert result.is_ok()
-        assert result.value.id == "project-789"
-        assert result.value.name == "Test Project"
-        assert result.value.description == "A test project"
-        assert result.value.tenant_id == "tenant-123"
-        assert result.value.status == ProjectStatus.active
-
-        # Verify repository create was called
-        mock_repo_instance.create.assert_called_once()
-
-        # Verify commit was called
-        mock_uow.commit.assert_called_once()
-
-        # Verify audit event was logged
-        mock_audit_service.log_event.assert_called_once_with(
-            event_type="project_created",
-            tenant_id="tenant-123",
-            user_id="user-456",
-            resource_type="project",
-            resource_id="project-789",
-            metadata={"project_name": "Test Project"},
-        )
-
-
-@pytest.mark.asyncio
-async def test_create_project_empty_name(mock_uow):
+    project_repo.create.return_value = mock_project
+
+    result = await use_case.execute(command)
+
+    assert result.is_ok()
+    assert result.value.id == "project-789"
+    assert result.value.name == "Test Project"
+    assert result.value.description == "A test project"
+    assert result.value.tenant_id == "tenant-123"
+    assert result.value.status == ProjectStatus.active
+
+    # Verify repository create was called
+    assert project_repo.create.call_count == 1
+
+    # Verify commit was called
+    assert fake_uow.commit.call_count == 1
+
+    # Verify audit event was logged
+    mock_audit_service.log_event.assert_called_once_with(
+        event_type="project_created",
+        tenant_id="tenant-123",
+        user_id="user-456",
+        resource_type="project",
+        resource_id="project-789",
+        metadata={"project_name": "Test Project"},
+    )
+
+
+async def test_create_project_empty_name(fake_uow):
     """Test project creation with empty name returns error"""
-    # Arrange
-    mock_audit_service = AsyncMock()
-    use_case = CreateProjectUseCase(mock_uow, mock_audit_service)
+    mock_audit_service = FakeRepo("log_event")
+    use_case = CreateProjectUseCase(fake_uow, mock_audit_service)
 
     command = CreateProjectCommand(
         name="",
@@ -76,10 +82,8 @@ async def test_create_project_empty_name(mock_uow):
         user_id="user-456",
     )
 
-    # Act
     result = await use_case.execute(command)
 
-    # Assert
     assert result.is_err()
     assert result.error.code == "INVALID_INPUT"
     assert "name cannot be empty" in result.error.message.lower()
@@ -88,12 +92,10 @@ async def test_create_project_empty_name(mock_uow):
     mock_audit_service.log_event.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_create_project_whitespace_name(mock_uow):
+async def test_create_project_whitespace_name(fake_uow):
     """Test project creation with whitespace-only name returns error"""
-    # Arrange
-    mock_audit_service = AsyncMock()
-    use_case = CreateProjectUseCase(mock_uow, mock_audit_service)
+    mock_audit_service = FakeRepo("log_event")
+    use_case = CreateProjectUseCase(fake_uow, mock_audit_service)
 
     command = CreateProjectCommand(
         name="   ",
@@ -102,9 +104,7 @@ async def test_create_project_whitespace_name(mock_uow):
         user_id="user-456",
     )
 
-    # Act
     result = await use_case.execute(command)
 
-    # Assert
     assert result.is_err()
     assert result.error.code == "INVALID_INPUT"
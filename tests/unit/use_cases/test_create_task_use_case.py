@@ -1,27 +1,94 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+import src.app.use_cases.tasks.create_task_use_case as create_task_module
 from src.app.use_cases.tasks import CreateTaskUseCase, CreateTaskCommand
 from src.app.services.input_spec_validator import InputSpecValidator
 from src.domain import Task, Project, TaskStatus, ProjectStatus
 from libs.result import Return, Error
+from tests.utils.stubs import FakeRepo, assert_kwargs
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="create_task"),
+    pytest.mark.fast,
+]
 
-@pytest.mark.asyncio
-async def test_create_task_success(mock_uow):
-    """Test successful task creation"""
-    # Arrange
-    mock_audit_service = AsyncMock()
-    input_spec_validator = InputSpecValidator()
-    use_case = CreateTaskUseCase(mock_uow, mock_audit_service, input_spec_validator)
+# Read-only: the use case only checks its status
+_ARCHIVED_PROJECT = Project(
+    id="project-123",
+    tenant_id="tenant-123",
+    name="Archived Project",
+    status=ProjectStatus.archived,
+)
+
+
+@pytest.fixture(scope="module")
+def mock_audit_service():
+    """Create a stub audit service, shared across the module and reset per test"""
+    return FakeRepo("log_event")
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_audit_service):
+    """Clear recorded audit calls so no test sees another's"""
+    mock_audit_service.reset()
 
-    command = CreateTaskCommand(
+
+@pytest.fixture(scope="module")
+def base_command():
+    """Valid command for project-123; tests derive variants with model_copy(update=...)"""
+    return CreateTaskCommand(
         project_id="project-123",
         title="Test Task",
-        input_spec={"requirement": "Build a feature", "priority": "high"},
+        input_spec={"requirement": "Build a feature"},
         tenant_id="tenant-123",
         user_id="user-456",
     )
 
+
+@pytest.fixture(scope="module")
+def input_spec_validator():
+    """Create the input spec validator once - it keeps no state between validate() calls"""
+    return InputSpecValidator()
+
+
+@pytest.fixture
+def create_task_use_case(fake_uow, mock_audit_service, input_spec_validator):
+    """CreateTaskUseCase over the per-test unit of work and the shared audit mock and validator"""
+    return CreateTaskUseCase(fake_uow, mock_audit_service, input_spec_validator)
+
+
+@pytest.fixture
+def project_repo():
+    """Stub standing in for SqlAlchemyProjectRepository"""
+    return FakeRepo("get_by_id")
+
+
+@pytest.fixture
+def task_repo():
+    """Stub standing in for SqlAlchemyTaskRepository"""
+    return FakeRepo("create")
+
+
+@pytest.fixture(autouse=True)
+def _swap_repositories(monkeypatch, project_repo, task_repo):
+    """Point the use case module's repository classes at the stubs for one test"""
+    monkeypatch.setattr(
+        create_task_module, "SqlAlchemyProjectRepository", lambda *args, **kwargs: project_repo
+    )
+    monkeypatch.setattr(
+        create_task_module, "SqlAlchemyTaskRepository", lambda *args, **kwargs: task_repo
+    )
+
+
+async def test_create_task_success(
+    create_task_use_case, fake_uow, mock_audit_service, base_command, project_repo, task_repo
+):
+    """Test successful task creation"""
+    # Arrange
+    command = base_command.model_copy(
+        update={"input_spec": {"requirement": "Build a feature", "priority": "high"}}
+    )
+
     # Mock existing project
     existing_project = Project(
         id="project-123",
@@ -40,200 +107,95 @@ async def test_create_task_success(mock_uow):
         status=TaskStatus.draft,
     )
 
-    # Mock the repositories
-    with patch(
-        "src.app.use_cases.tasks.create_task_use_case.SqlAlchemyProjectRepository"
-    ) as MockProjectRepo, patch(
-        "src.app.use_cases.tasks.create_task_use_case.SqlAlchemyTaskRepository"
-    ) as MockTaskRepo:
-        mock_project_repo_instance = MockProjectRepo.return_value
-        mock_project_repo_instance.get_by_id = AsyncMock(return_value=existing_project)
-
-        mock_task_repo_instance = MockTaskRepo.return_value
-        mock_task_repo_instance.create = AsyncMock(return_value=mock_task)
-
-        # Act
-        result = await use_case.execute(command)
-
-        # Assert
-        assert result.is_ok()
-        assert result.value.id == "task-789"
-        assert result.value.title == "Test Task"
-        assert result.value.project_id == "project-123"
-        assert result.value.tenant_id == "tenant-123"
-        assert result.value.status == TaskStatus.draft
-        assert result.value.input_spec == {"requirement": "Build a feature", "priority": "high"}
-
-        # Verify project was checked
-        mock_project_repo_instance.get_by_id.assert_called_once_with("project-123")
-
-        # Verify task was created
-        mock_task_repo_instance.create.assert_called_once()
-
-        # Verify commit was called
-        mock_uow.commit.assert_called_once()
-
-        # Verify audit event was logged
-        mock_audit_service.log_event.assert_called_once()
-        call_args = mock_audit_service.log_event.call_args[1]
-        assert call_args["event_type"] == "task_created"
-        assert call_args["resource_id"] == "task-789"
-
-
-@pytest.mark.asyncio
-async def test_create_task_empty_title(mock_uow):
-    """Test task creation with empty title returns error"""
-    # Arrange
-    mock_audit_service = AsyncMock()
-    input_spec_validator = InputSpecValidator()
-    use_case = CreateTaskUseCase(mock_uow, mock_audit_service, input_spec_validator)
-
-    command = CreateTaskCommand(
-        project_id="project-123",
-        title="",
-        input_spec={"requirement": "Build a feature"},
-        tenant_id="tenant-123",
-        user_id="user-456",
-    )
+    project_repo.get_by_id.return_value = existing_project
+    task_repo.create.return_value = mock_task
 
     # Act
-    result = await use_case.execute(command)
+    result = await create_task_use_case.execute(command)
 
     # Assert
-    assert result.is_err()
-    assert result.error.code == "INVALID_INPUT"
-    assert "title cannot be empty" in result.error.message.lower()
-
-    # Verify no audit event was logged
-    mock_audit_service.log_event.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_create_task_invalid_input_spec(mock_uow):
-    """Test task creation with invalid input_spec returns error"""
+    assert result.is_ok()
+    assert result.value.id == "task-789"
+    assert result.value.title == "Test Task"
+    assert result.value.project_id == "project-123"
+    assert result.value.tenant_id == "tenant-123"
+    assert result.value.status == TaskStatus.draft
+    assert result.value.input_spec == {"requirement": "Build a feature", "priority": "high"}
+
+    # Verify project was checked
+    project_repo.get_by_id.assert_called_once_with("project-123")
+
+    # Verify task was created
+    assert task_repo.create.call_count == 1
+
+    # Verify commit was called
+    fake_uow.commit.assert_called_once()
+
+    # Verify audit event was logged
+    assert mock_audit_service.log_event.call_count == 1
+    assert_kwargs(mock_audit_service.log_event, event_type="task_created", resource_id="task-789")
+
+
+@pytest.mark.parametrize(
+    "update, project, expected_code, message_needle",
+    [
+        pytest.param(
+            {"title": ""}, None, "INVALID_INPUT", "title cannot be empty", id="empty_title"
+        ),
+        pytest.param(
+            {"input_spec": {}}, None, "INVALID_INPUT_SPEC", "cannot be empty", id="empty_spec"
+        ),
+        pytest.param(
+            {"project_id": "non-existent-project"},
+            None,
+            "PROJECT_NOT_FOUND",
+            "non-existent-project",
+            id="project_not_found",
+        ),
+        pytest.param(
+            {}, _ARCHIVED_PROJECT, "PROJECT_NOT_ACTIVE", "non-active project", id="archived"
+        ),
+    ],
+)
+async def test_create_task_rejected(
+    create_task_use_case,
+    mock_audit_service,
+    base_command,
+    project_repo,
+    update,
+    project,
+    expected_code,
+    message_needle,
+):
+    """Test invalid input, a missing project and an archived project all return errors"""
     # Arrange
-    mock_audit_service = AsyncMock()
-    input_spec_validator = InputSpecValidator()
-    use_case = CreateTaskUseCase(mock_uow, mock_audit_service, input_spec_validator)
-
-    command = CreateTaskCommand(
-        project_id="project-123",
-        title="Test Task",
-        input_spec={},  # Empty input_spec is invalid
-        tenant_id="tenant-123",
-        user_id="user-456",
-    )
+    project_repo.get_by_id.return_value = project
 
     # Act
-    result = await use_case.execute(command)
+    result = await create_task_use_case.execute(base_command.model_copy(update=update))
 
     # Assert
     assert result.is_err()
-    assert result.error.code == "INVALID_INPUT_SPEC"
-    assert "cannot be empty" in result.error.message.lower()
-
-
-@pytest.mark.asyncio
-async def test_create_task_project_not_found(mock_uow):
-    """Test task creation when project doesn't exist"""
-    # Arrange
-    mock_audit_service = AsyncMock()
-    input_spec_validator = InputSpecValidator()
-    use_case = CreateTaskUseCase(mock_uow, mock_audit_service, input_spec_validator)
-
-    command = CreateTaskCommand(
-        project_id="non-existent-project",
-        title="Test Task",
-        input_spec={"requirement": "Build a feature"},
-        tenant_id="tenant-123",
-        user_id="user-456",
-    )
-
-    # Mock the repositories
-    with patch(
-        "src.app.use_cases.tasks.create_task_use_case.SqlAlchemyProjectRepository"
-    ) as MockProjectRepo:
-        mock_project_repo_instance = MockProjectRepo.return_value
-        mock_project_repo_instance.get_by_id = AsyncMock(return_value=None)
-
-        # Act
-        result = await use_case.execute(command)
-
-        # Assert
-        assert result.is_err()
-        assert result.error.code == "PROJECT_NOT_FOUND"
-        assert "non-existent-project" in result.error.message
-
-
-@pytest.mark.asyncio
-async def test_create_task_project_not_active(mock_uow):
-    """Test task creation fails when project is archived"""
-    # Arrange
-    mock_audit_service = AsyncMock()
-    input_spec_validator = InputSpecValidator()
-    use_case = CreateTaskUseCase(mock_uow, mock_audit_service, input_spec_validator)
-
-    command = CreateTaskCommand(
-        project_id="project-123",
-        title="Test Task",
-        input_spec={"requirement": "Build a feature"},
-        tenant_id="tenant-123",
-        user_id="user-456",
-    )
+    assert result.error.code == expected_code
+    assert message_needle in result.error.message.lower()
 
-    # Mock archived project
-    archived_project = Project(
-        id="project-123",
-        tenant_id="tenant-123",
-        name="Archived Project",
-        status=ProjectStatus.archived,
-    )
-
-    # Mock the repositories
-    with patch(
-        "src.app.use_cases.tasks.create_task_use_case.SqlAlchemyProjectRepository"
-    ) as MockProjectRepo:
-        mock_project_repo_instance = MockProjectRepo.return_value
-        mock_project_repo_instance.get_by_id = AsyncMock(return_value=archived_project)
-
-        # Act
-        result = await use_case.execute(command)
-
-        # Assert
-        assert result.is_err()
-        assert result.error.code == "PROJECT_NOT_ACTIVE"
-        assert "non-active project" in result.error.message.lower()
+    # Verify no audit event was logged
+    mock_audit_service.log_event.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_create_task_tenant_isolation(mock_uow):
+async def test_create_task_tenant_isolation(create_task_use_case, base_command, project_repo):
     """Test that task creation respects tenant isolation"""
     # Arrange
-    mock_audit_service = AsyncMock()
-    input_spec_validator = InputSpecValidator()
-    use_case = CreateTaskUseCase(mock_uow, mock_audit_service, input_spec_validator)
-
-    command = CreateTaskCommand(
-        project_id="project-123",
-        title="Test Task",
-        input_spec={"requirement": "Build a feature"},
-        tenant_id="tenant-999",  # Different tenant
-        user_id="user-456",
-    )
+    command = base_command.model_copy(update={"tenant_id": "tenant-999"})  # Different tenant
 
-    # Mock the repositories
-    with patch(
-        "src.app.use_cases.tasks.create_task_use_case.SqlAlchemyProjectRepository"
-    ) as MockProjectRepo:
-        mock_project_repo_instance = MockProjectRepo.return_value
-        mock_project_repo_instance.get_by_id = AsyncMock(return_value=None)
+    project_repo.get_by_id.return_value = None
 
-        # Act
-        result = await use_case.execute(command)
+    # Act
+    result = await create_task_use_case.execute(command)
 
-        # Assert
-        assert result.is_err()
-        assert result.error.code == "PROJECT_NOT_FOUND"
+    # Assert
+    assert result.is_err()
+    assert result.error.code == "PROJECT_NOT_FOUND"
 
-        # Verify get_by_id was called with project_id
-        mock_project_repo_instance.get_by_id.assert_called_once_with("project-123")
+    # Verify get_by_id was called with project_id
+    project_repo.get_by_id.assert_called_once_with("project-123")
@@ -2,40 +2,19 @@
 Unit tests for GetArtifactUseCase (UC-27)
 """
 import pytest
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
 from src.app.use_cases.artifacts import GetArtifactUseCase
 from src.domain.artifact import Artifact
 from src.domain.enums import ArtifactType, ArtifactStatus
-from src.domain.task import Task
-
-
-@pytest.fixture
-def mock_uow():
-    """Create a mock unit of work"""
-    uow = MagicMock()
-    uow.__aenter__ = AsyncMock(return_value=uow)
-    uow.__aexit__ = AsyncMock()
-    uow.commit = AsyncMock()
-    uow.rollback = AsyncMock()
-    uow.tasks = MagicMock()
-    uow.artifacts = MagicMock()
-    return uow
-
-
-@pytest.fixture
-def sample_task():
-    """Create a sample task"""
-    return Task(
-        id="task-123",
-        project_id="project-456",
-        tenant_id="tenant-789",
-        title="Test Task",
-        input_spec={"requirement": "test"},
-    )
+from tests.utils.clock import FIXED_NOW
+
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="get_artifact"),
+    pytest.mark.fast,
+]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_artifact():
     """Create a sample artifact"""
     return Artifact(
@@ -47,18 +26,17 @@ def sample_artifact():
         status=ArtifactStatus.draft,
         version=1,
         content={"files": [{"name": "main.py", "content": "print('hello')"}]},
-        created_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
     )
 
 
-@pytest.mark.asyncio
-async def test_get_artifact_success(mock_uow, sample_task, sample_artifact):
+async def test_get_artifact_success(fake_uow, sample_task, sample_artifact):
     """AC-1.1.1: Get artifact by ID successfully"""
     # Arrange
-    mock_uow.artifacts.get_by_id = AsyncMock(return_value=sample_artifact)
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=sample_task)
+    fake_uow.artifacts.get_by_id.return_value = sample_artifact
+    fake_uow.tasks.get_by_id.return_value = sample_task
 
-    use_case = GetArtifactUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetArtifactUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("artifact-1")
@@ -74,17 +52,16 @@ async def test_get_artifact_success(mock_uow, sample_task, sample_artifact):
     assert "files" in result.value.content
 
     # Verify repository calls
-    mock_uow.artifacts.get_by_id.assert_called_once_with("artifact-1")
-    mock_uow.tasks.get_by_id.assert_called_once_with("task-123", "tenant-789")
+    fake_uow.artifacts.get_by_id.assert_called_once_with("artifact-1")
+    fake_uow.tasks.get_by_id.assert_called_once_with("task-123", "tenant-789")
 
 
-@pytest.mark.asyncio
-async def test_get_artifact_not_found(mock_uow):
+async def test_get_artifact_not_found(fake_uow):
     """AC-1.1.2: Artifact not found returns 404"""
     # Arrange
-    mock_uow.artifacts.get_by_id = AsyncMock(return_value=None)
+    fake_uow.artifacts.get_by_id.return_value = None
 
-    use_case = GetArtifactUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetArtifactUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("nonexistent-artifact")
@@ -95,14 +72,13 @@ async def test_get_artifact_not_found(mock_uow):
     assert result.error.message == "Artifact not found"
 
 
-@pytest.mark.asyncio
-async def test_get_artifact_tenant_isolation(mock_uow, sample_artifact):
+async def test_get_artifact_tenant_isolation(fake_uow, sample_artifact):
     """AC-1.1.3: Tenant isolation - artifact from other tenant returns 404"""
     # Arrange
-    mock_uow.artifacts.get_by_id = AsyncMock(return_value=sample_artifact)
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=None)  # Task not found for this tenant
+    fake_uow.artifacts.get_by_id.return_value = sample_artifact
+    fake_uow.tasks.get_by_id.return_value = None  # Task not found for this tenant
 
-    use_case = GetArtifactUseCase(mock_uow, tenant_id="different-tenant")
+    use_case = GetArtifactUseCase(fake_uow, tenant_id="different-tenant")
 
     # Act
     result = await use_case.execute("artifact-1")
@@ -112,4 +88,4 @@ async def test_get_artifact_tenant_isolation(mock_uow, sample_artifact):
     assert result.error.code == "ARTIFACT_NOT_FOUND"
 
     # Verify tenant isolation via task lookup
-    mock_uow.tasks.get_by_id.assert_called_once_with("task-123", "different-tenant")
+    fake_uow.tasks.get_by_id.assert_called_once_with("task-123", "different-tenant")
@@ -2,77 +2,67 @@
 Unit tests for GetExportJobStatusUseCase (UC-30)
 """
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from datetime import timedelta
 from src.app.use_cases.exports import GetExportJobStatusUseCase
 from src.domain.export_job import ExportJob
 from src.domain.enums import ExportJobStatus
+from tests.utils.clock import FIXED_NOW
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="get_export_job_status"),
+    pytest.mark.fast,
+]
 
-@pytest.fixture
-def mock_uow():
-    """Create a mock unit of work"""
-    uow = MagicMock()
-    uow.__aenter__ = AsyncMock(return_value=uow)
-    uow.__aexit__ = AsyncMock()
-    uow.commit = AsyncMock()
-    uow.rollback = AsyncMock()
-    uow.export_jobs = MagicMock()
-    return uow
+# Fields shared by every export job fixture
+_EXPORT_JOB_FIELDS = {"id": "job-123", "project_id": "project-456", "tenant_id": "tenant-789"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pending_export_job():
     """Create a pending export job"""
     return ExportJob(
-        id="job-123",
-        project_id="project-456",
-        tenant_id="tenant-789",
+        **_EXPORT_JOB_FIELDS,
         status=ExportJobStatus.pending,
-        created_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def completed_export_job():
     """Create a completed export job"""
-    expires_at = datetime.utcnow() + timedelta(hours=1)
+    expires_at = FIXED_NOW + timedelta(hours=1)
     return ExportJob(
-        id="job-123",
-        project_id="project-456",
-        tenant_id="tenant-789",
+        **_EXPORT_JOB_FIELDS,
         status=ExportJobStatus.completed,
         file_path="exports/tenant-789/project-456/job-123.zip",
         download_url="http://localhost:8000/files/exports/tenant-789/project-456/job-123.zip",
         expires_at=expires_at,
-        created_at=datetime.utcnow() - timedelta(minutes=5),
-        started_at=datetime.utcnow() - timedelta(minutes=4),
-        completed_at=datetime.utcnow(),
+        created_at=FIXED_NOW - timedelta(minutes=5),
+        started_at=FIXED_NOW - timedelta(minutes=4),
+        completed_at=FIXED_NOW,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def failed_export_job():
     """Create a failed export job"""
     return ExportJob(
-        id="job-123",
-        project_id="project-456",
-        tenant_id="tenant-789",
+        **_EXPORT_JOB_FIELDS,
         status=ExportJobStatus.failed,
         error_message="Failed to generate ZIP",
-        created_at=datetime.utcnow() - timedelta(minutes=5),
-        started_at=datetime.utcnow() - timedelta(minutes=4),
-        completed_at=datetime.utcnow(),
+        created_at=FIXED_NOW - timedelta(minutes=5),
+        started_at=FIXED_NOW - timedelta(minutes=4),
+        completed_at=FIXED_NOW,
     )
 
 
-@pytest.mark.asyncio
-async def test_get_export_job_status_pending(mock_uow, pending_export_job):
+async def test_get_export_job_status_pending(fake_uow, pending_export_job):
     """Get status of pending export job"""
     # Arrange
-    mock_uow.export_jobs.get_by_id = AsyncMock(return_value=pending_export_job)
+    fake_uow.export_jobs.get_by_id.return_value = pending_export_job
 
-    use_case = GetExportJobStatusUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetExportJobStatusUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("job-123")
@@ -86,13 +76,12 @@ async def test_get_export_job_status_pending(mock_uow, pending_export_job):
     assert result.value.error_message is None
 
 
-@pytest.mark.asyncio
-async def test_get_export_job_status_completed(mock_uow, completed_export_job):
+async def test_get_export_job_status_completed(fake_uow, completed_export_job):
     """AC-3.1.2: Get status of completed export job with download URL"""
     # Arrange
-    mock_uow.export_jobs.get_by_id = AsyncMock(return_value=completed_export_job)
+    fake_uow.export_jobs.get_by_id.return_value = completed_export_job
 
-    use_case = GetExportJobStatusUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetExportJobStatusUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("job-123")
@@ -107,13 +96,12 @@ async def test_get_export_job_status_completed(mock_uow, completed_export_job):
     assert result.value.completed_at is not None
 
 
-@pytest.mark.asyncio
-async def test_get_export_job_status_failed(mock_uow, failed_export_job):
+async def test_get_export_job_status_failed(fake_uow, failed_export_job):
     """Get status of failed export job with error message"""
     # Arrange
-    mock_uow.export_jobs.get_by_id = AsyncMock(return_value=failed_export_job)
+    fake_uow.export_jobs.get_by_id.return_value = failed_export_job
 
-    use_case = GetExportJobStatusUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetExportJobStatusUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("job-123")
@@ -126,13 +114,12 @@ async def test_get_export_job_status_failed(mock_uow, failed_export_job):
     assert result.value.download_url is None
 
 
-@pytest.mark.asyncio
-async def test_get_export_job_status_not_found(mock_uow):
+async def test_get_export_job_status_not_found(fake_uow):
     """Export job not found returns error"""
     # Arrange
-    mock_uow.export_jobs.get_by_id = AsyncMock(return_value=None)
+    fake_uow.export_jobs.get_by_id.return_value = None
 
-    use_case = GetExportJobStatusUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetExportJobStatusUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("nonexistent-job")
@@ -142,13 +129,12 @@ async def test_get_export_job_status_not_found(mock_uow):
     assert result.error.code == "EXPORT_JOB_NOT_FOUND"
 
 
-@pytest.mark.asyncio
-async def test_get_export_job_status_tenant_isolation(mock_uow, pending_export_job):
+async def test_get_export_job_status_tenant_isolation(fake_uow, pending_export_job):
     """Tenant isolation - job from other tenant returns not found"""
     # Arrange
-    mock_uow.export_jobs.get_by_id = AsyncMock(return_value=None)
+    fake_uow.export_jobs.get_by_id.return_value = None
 
-    use_case = GetExportJobStatusUseCase(mock_uow, tenant_id="different-tenant")
+    use_case = GetExportJobStatusUseCase(fake_uow, tenant_id="different-tenant")
 
     # Act
     result = await use_case.execute("job-123")
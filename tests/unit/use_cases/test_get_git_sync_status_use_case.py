@@ -2,82 +2,73 @@
 Unit tests for GetGitSyncStatusUseCase (UC-31)
 """
 import pytest
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
 from src.app.use_cases.git_sync import GetGitSyncStatusUseCase
 from src.domain.git_sync_job import GitSyncJob
 from src.domain.enums import GitSyncJobStatus
+from tests.utils.clock import FIXED_NOW
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="get_git_sync_status"),
+    pytest.mark.fast,
+]
 
-@pytest.fixture
-def mock_uow():
-    """Create a mock unit of work"""
-    uow = MagicMock()
-    uow.__aenter__ = AsyncMock(return_value=uow)
-    uow.__aexit__ = AsyncMock()
-    uow.git_sync_jobs = MagicMock()
-    return uow
+# Fields shared by every Git sync job fixture
+_GIT_SYNC_JOB_FIELDS = {
+    "artifact_id": "artifact-1",
+    "tenant_id": "tenant-789",
+    "repository_url": "https://github.com/test/repo",
+    "branch": "main",
+    "commit_message": "Test commit",
+}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pending_job():
     """Create a pending Git sync job"""
     return GitSyncJob(
         id="job-123",
-        artifact_id="artifact-1",
-        tenant_id="tenant-789",
-        repository_url="https://github.com/test/repo",
-        branch="main",
-        commit_message="Test commit",
+        **_GIT_SYNC_JOB_FIELDS,
         status=GitSyncJobStatus.pending,
-        created_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def completed_job():
     """Create a completed Git sync job"""
     return GitSyncJob(
         id="job-456",
-        artifact_id="artifact-1",
-        tenant_id="tenant-789",
-        repository_url="https://github.com/test/repo",
-        branch="main",
-        commit_message="Test commit",
+        **_GIT_SYNC_JOB_FIELDS,
         status=GitSyncJobStatus.completed,
         commit_sha="abc123def456",
-        created_at=datetime.utcnow(),
-        started_at=datetime.utcnow(),
-        completed_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
+        started_at=FIXED_NOW,
+        completed_at=FIXED_NOW,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def failed_job():
     """Create a failed Git sync job"""
     return GitSyncJob(
         id="job-789",
-        artifact_id="artifact-1",
-        tenant_id="tenant-789",
-        repository_url="https://github.com/test/repo",
-        branch="main",
-        commit_message="Test commit",
+        **_GIT_SYNC_JOB_FIELDS,
         status=GitSyncJobStatus.failed,
         error_message="Authentication failed",
         retry_count=1,
-        created_at=datetime.utcnow(),
-        started_at=datetime.utcnow(),
-        completed_at=datetime.utcnow(),
+        created_at=FIXED_NOW,
+        started_at=FIXED_NOW,
+        completed_at=FIXED_NOW,
     )
 
 
-@pytest.mark.asyncio
-async def test_get_pending_job_status(mock_uow, pending_job):
+async def test_get_pending_job_status(fake_uow, pending_job):
     """Get status of pending job"""
     # Arrange
-    mock_uow.git_sync_jobs.get_by_id = AsyncMock(return_value=pending_job)
+    fake_uow.git_sync_jobs.get_by_id.return_value = pending_job
 
-    use_case = GetGitSyncStatusUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetGitSyncStatusUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("job-123")
@@ -90,13 +81,12 @@ async def test_get_pending_job_status(mock_uow, pending_job):
     assert result.value.error_message is None
 
 
-@pytest.mark.asyncio
-async def test_get_completed_job_status(mock_uow, completed_job):
+async def test_get_completed_job_status(fake_uow, completed_job):
     """Get status of completed job with commit SHA"""
     # Arrange
-    mock_uow.git_sync_jobs.get_by_id = AsyncMock(return_value=completed_job)
+    fake_uow.git_sync_jobs.get_by_id.return_value = completed_job
 
-    use_case = GetGitSyncStatusUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetGitSyncStatusUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("job-456")
@@ -109,13 +99,12 @@ async def test_get_completed_job_status(mock_uow, completed_job):
     assert result.value.completed_at is not None
 
 
-@pytest.mark.asyncio
-async def test_get_failed_job_status(mock_uow, failed_job):
+async def test_get_failed_job_status(fake_uow, failed_job):
     """Get status of failed job with error message"""
     # Arrange
-    mock_uow.git_sync_jobs.get_by_id = AsyncMock(return_value=failed_job)
+    fake_uow.git_sync_jobs.get_by_id.return_value = failed_job
 
-    use_case = GetGitSyncStatusUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetGitSyncStatusUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("job-789")
@@ -128,13 +117,12 @@ async def test_get_failed_job_status(mock_uow, failed_job):
     assert result.value.retry_count == 1
 
 
-@pytest.mark.asyncio
-async def test_get_job_not_found(mock_uow):
+async def test_get_job_not_found(fake_uow):
     """Job not found returns error"""
     # Arrange
-    mock_uow.git_sync_jobs.get_by_id = AsyncMock(return_value=None)
+    fake_uow.git_sync_jobs.get_by_id.return_value = None
 
-    use_case = GetGitSyncStatusUseCase(mock_uow, tenant_id="tenant-789")
+    use_case = GetGitSyncStatusUseCase(fake_uow, tenant_id="tenant-789")
 
     # Act
     result = await use_case.execute("nonexistent-job")
@@ -144,13 +132,12 @@ async def test_get_job_not_found(mock_uow):
     assert result.error.code == "GIT_SYNC_JOB_NOT_FOUND"
 
 
-@pytest.mark.asyncio
-async def test_tenant_isolation(mock_uow):
+async def test_tenant_isolation(fake_uow):
     """Tenant isolation - job from other tenant returns not found"""
     # Arrange
-    mock_uow.git_sync_jobs.get_by_id = AsyncMock(return_value=None)
+    fake_uow.git_sync_jobs.get_by_id.return_value = None
 
-    use_case = GetGitSyncStatusUseCase(mock_uow, tenant_id="different-tenant")
+    use_case = GetGitSyncStatusUseCase(fake_uow, tenant_id="different-tenant")
 
     # Act
     result = await use_case.execute("job-123")
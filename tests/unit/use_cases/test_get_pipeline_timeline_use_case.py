@@ -1,69 +1,91 @@
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock
+from unittest.mock import call
 from src.app.use_cases.pipelines import GetPipelineTimelineUseCase
 from src.domain.pipeline_run import PipelineRun
 from src.domain.pipeline_step import PipelineStepRun
 from src.domain.task import Task
 from src.domain.enums import PipelineStatus, StepStatus, TaskStatus, StepType
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group(name="get_pipeline_timeline"),
+    pytest.mark.fast,
+]
+
+# Run/step timestamps: minutes 0, 1, 2 and 5 past 10:00
+_T0 = datetime(2025, 1, 1, 10, 0, 0)
+_T1 = datetime(2025, 1, 1, 10, 1, 0)
+_T2 = datetime(2025, 1, 1, 10, 2, 0)
+_T5 = datetime(2025, 1, 1, 10, 5, 0)
+
+# Name and type of each step number of run-789
+_STEP_KINDS = {
+    1: ("Analysis Step", StepType.ANALYSIS),
+    2: ("User Stories Step", StepType.USER_STORIES),
+}
+
+
+def make_run(**fields):
+    """Build running pipeline run run-789 of task-456 with the given field overrides"""
+    return PipelineRun(
+        **{
+            "id": "run-789",
+            "task_id": "task-456",
+            "tenant_id": "tenant-123",
+            "status": PipelineStatus.running,
+            "started_at": _T0,
+            **fields,
+        }
+    )
 
-@pytest.mark.asyncio
-async def test_get_pipeline_timeline_success_default_run(mock_uow):
-    """Test successful retrieval of most recent pipeline run"""
-    # Arrange
-    tenant_id = "tenant-123"
-    task_id = "task-456"
-    pipeline_run_id = "run-789"
 
-    # Mock task
-    mock_task = Task(
-        id=task_id,
-        tenant_id=tenant_id,
+def make_step(n, status, started_at, completed_at=None):
+    """Build step ``n`` of run-789"""
+    step_name, step_type = _STEP_KINDS[n]
+    return PipelineStepRun(
+        id=f"step-{n}",
+        pipeline_run_id="run-789",
+        step_number=n,
+        step_name=step_name,
+        step_type=step_type,
+        status=status,
+        started_at=started_at,
+        completed_at=completed_at,
+    )
+
+
+@pytest.fixture(scope="module")
+def base_task():
+    """Running task-456 of tenant-123, built once per module - tests copy it to vary fields"""
+    return Task(
+        id="task-456",
+        tenant_id="tenant-123",
         project_id="project-123",
         title="Test Task",
         input_spec={"test": "data"},
         status=TaskStatus.running,
     )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
-
-    # Mock pipeline run
-    mock_pipeline_run = PipelineRun(
-        id=pipeline_run_id,
-        task_id=task_id,
-        tenant_id=tenant_id,
-        status=PipelineStatus.running,
-        started_at=datetime(2025, 1, 1, 10, 0, 0),
-        completed_at=None,
-    )
-    mock_uow.pipeline_runs.get_by_task_id = AsyncMock(return_value=mock_pipeline_run)
 
-    # Mock pipeline steps
-    mock_steps = [
-        PipelineStepRun(
-            id="step-1",
-            pipeline_run_id=pipeline_run_id,
-            step_number=1,
-            step_name="Analysis Step",
-            step_type=StepType.ANALYSIS,
-            status=StepStatus.completed,
-            started_at=datetime(2025, 1, 1, 10, 0, 0),
-            completed_at=datetime(2025, 1, 1, 10, 1, 0),
-        ),
-        PipelineStepRun(
-            id="step-2",
-            pipeline_run_id=pipeline_run_id,
-            step_number=2,
-            step_name="User Stories Step",
-            step_type=StepType.USER_STORIES,
-            status=StepStatus.running,
-            started_at=datetime(2025, 1, 1, 10, 1, 0),
-            completed_at=None,
-        ),
-    ]
-    mock_uow.pipeline_steps.get_by_pipeline_run_id = AsyncMock(return_value=mock_steps)
 
-    use_case = GetPipelineTimelineUseCase(uow=mock_uow, tenant_id=tenant_id)
+@pytest.fixture
+def use_case(fake_uow):
+    """GetPipelineTimelineUseCase for tenant-123 over the per-test stub unit of work"""
+    return GetPipelineTimelineUseCase(uow=fake_uow, tenant_id="tenant-123")
+
+
+async def test_get_pipeline_timeline_success_default_run(use_case, fake_uow, base_task):
+    """Test successful retrieval of most recent pipeline run"""
+    # Arrange
+    task_id = "task-456"
+    pipeline_run_id = "run-789"
+
+    fake_uow.tasks.get_by_id.return_value = base_task
+    fake_uow.pipeline_runs.get_by_task_id.return_value = make_run()
+    fake_uow.pipeline_steps.get_by_pipeline_run_id.return_value = [
+        make_step(1, StepStatus.completed, _T0, _T1),
+        make_step(2, StepStatus.running, _T1),
+    ]
 
     # Act
     result = await use_case.execute(task_id)
@@ -71,264 +93,150 @@ async def test_get_pipeline_timeline_success_default_run(mock_uow):
     # Assert
     assert result.is_ok()
     response = result.value
-    assert response.id == pipeline_run_id
-    assert response.task_id == task_id
-    assert response.status == "running"
-    assert response.started_at == datetime(2025, 1, 1, 10, 0, 0)
-    assert response.completed_at is None
-    assert response.error_message is None
-    assert len(response.steps) == 2
-    assert response.steps[0].step_number == 1
-    assert response.steps[0].step_name == "Analysis Step"
-    assert response.steps[0].status == "completed"
-    assert response.steps[1].step_number == 2
-    assert response.steps[1].step_name == "User Stories Step"
-    assert response.steps[1].status == "running"
+    assert response.model_dump(exclude={"steps"}) == {
+        "id": pipeline_run_id,
+        "task_id": task_id,
+        "status": "running",
+        "started_at": _T0,
+        "completed_at": None,
+        "error_message": None,
+    }
+    assert [
+        step.model_dump(include={"step_number", "step_name", "status"})
+        for step in response.steps
+    ] == [
+        {"step_number": 1, "step_name": "Analysis Step", "status": "completed"},
+        {"step_number": 2, "step_name": "User Stories Step", "status": "running"},
+    ]
 
-    # Verify repository calls
-    mock_uow.tasks.get_by_id.assert_called_once_with(task_id, tenant_id)
-    mock_uow.pipeline_runs.get_by_task_id.assert_called_once_with(task_id)
-    mock_uow.pipeline_steps.get_by_pipeline_run_id.assert_called_once_with(pipeline_run_id)
+    # Verify repository calls, each made exactly once
+    assert (
+        fake_uow.tasks.get_by_id.call_args_list,
+        fake_uow.pipeline_runs.get_by_task_id.call_args_list,
+        fake_uow.pipeline_steps.get_by_pipeline_run_id.call_args_list,
+    ) == ([call(task_id, "tenant-123")], [call(task_id)], [call(pipeline_run_id)])
 
 
-@pytest.mark.asyncio
-async def test_get_pipeline_timeline_success_specific_run(mock_uow):
+async def test_get_pipeline_timeline_success_specific_run(use_case, fake_uow, base_task):
     """Test successful retrieval of specific pipeline run"""
     # Arrange
-    tenant_id = "tenant-123"
     task_id = "task-456"
     pipeline_run_id = "run-specific"
 
-
-    # Mock task
-    mock_task = Task(
-        id=task_id,
-        tenant_id=tenant_id,
-        project_id="project-123",
-        title="Test Task",
-        input_spec={"test": "data"},
-        status=TaskStatus.completed,
+    fake_uow.tasks.get_by_id.return_value = base_task.model_copy(
+        update={"status": TaskStatus.completed}
     )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
-
-    # Mock pipeline run
-    mock_pipeline_run = PipelineRun(
-        id=pipeline_run_id,
-        task_id=task_id,
-        tenant_id=tenant_id,
-        status=PipelineStatus.completed,
-        started_at=datetime(2025, 1, 1, 10, 0, 0),
-        completed_at=datetime(2025, 1, 1, 10, 5, 0),
-        error_message=None,
+    mock_pipeline_run = make_run(
+        id=pipeline_run_id, status=PipelineStatus.completed, completed_at=_T5
     )
-    mock_uow.pipeline_runs.get_by_id = AsyncMock(return_value=mock_pipeline_run)
+    fake_uow.pipeline_runs.get_by_id.return_value = mock_pipeline_run
 
     # Mock pipeline steps (empty for simplicity)
-    mock_uow.pipeline_steps.get_by_pipeline_run_id = AsyncMock(return_value=[])
-
-    use_case = GetPipelineTimelineUseCase(uow=mock_uow, tenant_id=tenant_id)
+    fake_uow.pipeline_steps.get_by_pipeline_run_id.return_value = []
 
     # Act
     result = await use_case.execute(task_id, run_id=pipeline_run_id)
 
     # Assert
     assert result.is_ok()
-    response = result.value
-    assert response.id == pipeline_run_id
-    assert response.status == "completed"
-    assert response.completed_at == datetime(2025, 1, 1, 10, 5, 0)
-    assert len(response.steps) == 0
+    assert result.value.model_dump() == {
+        "id": pipeline_run_id,
+        "task_id": task_id,
+        "status": "completed",
+        "started_at": _T0,
+        "completed_at": _T5,
+        "error_message": None,
+        "steps": [],
+    }
 
     # Verify repository calls
-    mock_uow.pipeline_runs.get_by_id.assert_called_once_with(pipeline_run_id)
-
-
-@pytest.mark.asyncio
-async def test_get_pipeline_timeline_task_not_found(mock_uow):
-    """Test error when task does not exist"""
-    # Arrange
-    tenant_id = "tenant-123"
-    task_id = "non-existent-task"
-
-
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=None)
-
-    use_case = GetPipelineTimelineUseCase(uow=mock_uow, tenant_id=tenant_id)
-
-    # Act
-    result = await use_case.execute(task_id)
-
-    # Assert
-    assert result.is_err()
-    assert result.error.code == "TASK_NOT_FOUND"
-    assert result.error.message == "Task not found"
-
-
-@pytest.mark.asyncio
-async def test_get_pipeline_timeline_no_pipeline_run(mock_uow):
-    """Test error when no pipeline run exists for task"""
-    # Arrange
-    tenant_id = "tenant-123"
-    task_id = "task-456"
-
-
-    # Mock task
-    mock_task = Task(
-        id=task_id,
-        tenant_id=tenant_id,
-        project_id="project-123",
-        title="Test Task",
-        input_spec={"test": "data"},
-        status=TaskStatus.draft,
-    )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
+    fake_uow.pipeline_runs.get_by_id.assert_called_once_with(pipeline_run_id)
 
-    # No pipeline run found
-    mock_uow.pipeline_runs.get_by_task_id = AsyncMock(return_value=None)
 
-    use_case = GetPipelineTimelineUseCase(uow=mock_uow, tenant_id=tenant_id)
-
-    # Act
-    result = await use_case.execute(task_id)
-
-    # Assert
-    assert result.is_err()
-    assert result.error.code == "NO_PIPELINE_RUN"
-    assert result.error.message == "No pipeline run found for this task"
-
-
-@pytest.mark.asyncio
-async def test_get_pipeline_timeline_pipeline_run_not_found(mock_uow):
-    """Test error when specific pipeline run ID does not exist"""
-    # Arrange
-    tenant_id = "tenant-123"
-    task_id = "task-456"
-    pipeline_run_id = "non-existent-run"
-
-
-    # Mock task
-    mock_task = Task(
-        id=task_id,
-        tenant_id=tenant_id,
-        project_id="project-123",
-        title="Test Task",
-        input_spec={"test": "data"},
-        status=TaskStatus.running,
-    )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
-
-    # Pipeline run not found
-    mock_uow.pipeline_runs.get_by_id = AsyncMock(return_value=None)
-
-    use_case = GetPipelineTimelineUseCase(uow=mock_uow, tenant_id=tenant_id)
-
-    # Act
-    result = await use_case.execute(task_id, run_id=pipeline_run_id)
-
-    # Assert
-    assert result.is_err()
-    assert result.error.code == "PIPELINE_RUN_NOT_FOUND"
-    assert result.error.message == "Pipeline run not found"
-
-
-@pytest.mark.asyncio
-async def test_get_pipeline_timeline_invalid_pipeline_run(mock_uow):
-    """Test error when pipeline run does not belong to the task"""
+@pytest.mark.errors
+@pytest.mark.parametrize(
+    "task_exists, run_id, run_update, expected_code, expected_message",
+    [
+        pytest.param(
+            False, None, None, "TASK_NOT_FOUND", "Task not found", id="task_not_found"
+        ),
+        pytest.param(
+            True,
+            None,
+            None,
+            "NO_PIPELINE_RUN",
+            "No pipeline run found for this task",
+            id="no_pipeline_run",
+        ),
+        pytest.param(
+            True,
+            "non-existent-run",
+            None,
+            "PIPELINE_RUN_NOT_FOUND",
+            "Pipeline run not found",
+            id="pipeline_run_not_found",
+        ),
+        pytest.param(
+            True,
+            "run-789",
+            {"task_id": "different-task-id"},
+            "INVALID_PIPELINE_RUN",
+            "Pipeline run does not belong to this task",
+            id="run_of_other_task",
+        ),
+    ],
+)
+async def test_get_pipeline_timeline_rejected(
+    use_case,
+    fake_uow,
+    base_task,
+    task_exists,
+    run_id,
+    run_update,
+    expected_code,
+    expected_message,
+):
+    """Test the errors for a missing task, a missing run and a run of another task
+
+    run_update of None means no pipeline run is found, whether looked up by id or by task.
+    """
     # Arrange
-    tenant_id = "tenant-123"
-    task_id = "task-456"
-    pipeline_run_id = "run-789"
-
-
-    # Mock task
-    mock_task = Task(
-        id=task_id,
-        tenant_id=tenant_id,
-        project_id="project-123",
-        title="Test Task",
-        input_spec={"test": "data"},
-        status=TaskStatus.running,
-    )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
-
-    # Mock pipeline run with different task_id
-    mock_pipeline_run = PipelineRun(
-        id=pipeline_run_id,
-        task_id="different-task-id",
-        tenant_id=tenant_id,
-        status=PipelineStatus.running,
-        started_at=datetime(2025, 1, 1, 10, 0, 0),
-    )
-    mock_uow.pipeline_runs.get_by_id = AsyncMock(return_value=mock_pipeline_run)
-
-    use_case = GetPipelineTimelineUseCase(uow=mock_uow, tenant_id=tenant_id)
+    if task_exists:
+        fake_uow.tasks.get_by_id.return_value = base_task
+    if run_update is not None:
+        pipeline_run = make_run(**run_update)
+        fake_uow.pipeline_runs.get_by_id.return_value = pipeline_run
+        fake_uow.pipeline_runs.get_by_task_id.return_value = pipeline_run
 
     # Act
-    result = await use_case.execute(task_id, run_id=pipeline_run_id)
+    result = await use_case.execute("task-456", run_id=run_id)
 
     # Assert
     assert result.is_err()
-    assert result.error.code == "INVALID_PIPELINE_RUN"
-    assert result.error.message == "Pipeline run does not belong to this task"
+    assert result.error.code == expected_code
+    assert result.error.message == expected_message
+    fake_uow.pipeline_steps.get_by_pipeline_run_id.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_get_pipeline_timeline_with_failed_step(mock_uow):
+async def test_get_pipeline_timeline_with_failed_step(use_case, fake_uow, base_task):
     """Test pipeline timeline with a failed step"""
     # Arrange
-    tenant_id = "tenant-123"
     task_id = "task-456"
-    pipeline_run_id = "run-789"
-
 
-    # Mock task
-    mock_task = Task(
-        id=task_id,
-        tenant_id=tenant_id,
-        project_id="project-123",
-        title="Test Task",
-        input_spec={"test": "data"},
-        status=TaskStatus.failed,
+    fake_uow.tasks.get_by_id.return_value = base_task.model_copy(
+        update={"status": TaskStatus.failed}
     )
-    mock_uow.tasks.get_by_id = AsyncMock(return_value=mock_task)
 
     # Mock failed pipeline run
-    mock_pipeline_run = PipelineRun(
-        id=pipeline_run_id,
-        task_id=task_id,
-        tenant_id=tenant_id,
-        status=PipelineStatus.failed,
-        started_at=datetime(2025, 1, 1, 10, 0, 0),
-        completed_at=datetime(2025, 1, 1, 10, 2, 0),
-    )
-    mock_uow.pipeline_runs.get_by_task_id = AsyncMock(return_value=mock_pipeline_run)
+    mock_pipeline_run = make_run(status=PipelineStatus.failed, completed_at=_T2)
+    fake_uow.pipeline_runs.get_by_task_id.return_value = mock_pipeline_run
 
     # Mock pipeline steps with failure
     mock_steps = [
-        PipelineStepRun(
-            id="step-1",
-            pipeline_run_id=pipeline_run_id,
-            step_number=1,
-            step_name="Analysis Step",
-            step_type=StepType.ANALYSIS,
-            status=StepStatus.completed,
-            started_at=datetime(2025, 1, 1, 10, 0, 0),
-            completed_at=datetime(2025, 1, 1, 10, 1, 0),
-        ),
-        PipelineStepRun(
-            id="step-2",
-            pipeline_run_id=pipeline_run_id,
-            step_number=2,
-            step_name="User Stories Step",
-            step_type=StepType.USER_STORIES,
-            status=StepStatus.failed,
-            started_at=datetime(2025, 1, 1, 10, 1, 0),
-            completed_at=datetime(2025, 1, 1, 10, 2, 0),
-        ),
+        make_step(1, StepStatus.completed, _T0, _T1),
+        make_step(2, StepStatus.failed, _T1, _T2),
     ]
-    mock_uow.pipeline_steps.get_by_pipeline_run_id = AsyncMock(return_value=mock_steps)
-
-    use_case = GetPipelineTimelineUseCase(uow=mock_uow, tenant_id=tenant_id)
+    fake_uow.pipeline_steps.get_by_pipeline_run_id.return_value = mock_steps
 
     # Act
     result = await use_case.execute(task_id)
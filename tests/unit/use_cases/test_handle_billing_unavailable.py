@@ -16,6 +16,8 @@ from src.app.use_cases.billing.dtos import (
 from src.domain.retry_job import RetryJob
 from src.domain.enums import RetryStatus
 
+pytestmark = pytest.mark.fast
+
 
 @pytest.fixture
 def mock_retry_job_repository():
@@ -9,6 +9,8 @@ from src.domain.artifact import Artifact
 from src.domain.enums import ArtifactType, ArtifactStatus
 from src.domain.task import Task
 
+pytestmark = pytest.mark.fast
+
 
 @pytest.fixture
 def mock_uow():
@@ -3,6 +3,8 @@ from unittest.mock import AsyncMock, patch
 from src.app.use_cases.tasks import ListProjectTasksUseCase, ListProjectTasksCommand
 from src.domain import Task, TaskStatus
 
+pytestmark = pytest.mark.fast
+
 
 @pytest.mark.asyncio
 async def test_list_project_tasks_success(mock_uow):
@@ -10,6 +10,8 @@ from src.domain.pipeline_run import PipelineRun
 from src.domain.enums import ArtifactType, ArtifactStatus, PipelineStatus
 from src.domain.task import Task
 
+pytestmark = pytest.mark.fast
+
 
 @pytest.fixture
 def mock_uow():
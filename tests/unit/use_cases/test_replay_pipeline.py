@@ -10,6 +10,8 @@ from src.domain.task import Task, TaskStatus
 from src.app.use_cases.pipeline.replay_pipeline import ReplayPipelineUseCase
 from src.app.use_cases.pipeline.dtos import ReplayPipelineCommandDTO, ReplayPipelineResponseDTO
 
+pytestmark = pytest.mark.fast
+
 
 @pytest.fixture
 def mock_uow():
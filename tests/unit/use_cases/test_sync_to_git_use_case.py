@@ -10,6 +10,8 @@ from src.domain.artifact import Artifact
 from src.domain.git_sync_job import GitSyncJob
 from src.domain.enums import ArtifactType, ArtifactStatus, GitSyncJobStatus
 
+pytestmark = pytest.mark.fast
+
 
 @pytest.fixture
 def mock_uow():
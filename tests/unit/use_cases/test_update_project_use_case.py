@@ -3,6 +3,8 @@ from unittest.mock import AsyncMock, patch
 from src.app.use_cases.projects import UpdateProjectUseCase, UpdateProjectCommand
 from src.domain import Project, ProjectStatus
 
+pytestmark = pytest.mark.fast
+
 
 @pytest.mark.asyncio
 async def test_update_project_success(mock_uow):
@@ -0,0 +1,3 @@
+from datetime import datetime
+
+FIXED_NOW = datetime(2025, 1, 1, 12, 0, 0)
@@ -0,0 +1,108 @@
+"""
+Lightweight unit-of-work stubs and mock helpers for use case and service tests
+"""
+import inspect
+from unittest.mock import call
+
+
+class AsyncCallRecorder:
+    """Plain async stand-in for an AsyncMock method
+
+    Records a ``call(...)`` per invocation and answers with ``side_effect`` (an
+    iterable of results, or a sync/async callable) or else ``return_value``.
+    """
+
+    __slots__ = ("call_args_list", "return_value", "_side_effect")
+
+    def __init__(self, return_value=None):
+        self.reset()
+        self.return_value = return_value
+
+    def reset(self):
+        """Forget recorded calls and side effects and go back to returning None"""
+        self.call_args_list = []
+        self.return_value = None
+        self._side_effect = None
+
+    @property
+    def call_args(self):
+        return self.call_args_list[-1] if self.call_args_list else None
+
+    @property
+    def call_count(self):
+        return len(self.call_args_list)
+
+    @property
+    def side_effect(self):
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, value):
+        self._side_effect = value if value is None or callable(value) else iter(value)
+
+    async def __call__(self, *args, **kwargs):
+        self.call_args_list.append(call(*args, **kwargs))
+        if self._side_effect is None:
+            return self.return_value
+        if callable(self._side_effect):
+            result = self._side_effect(*args, **kwargs)
+            return await result if inspect.isawaitable(result) else result
+        return next(self._side_effect)
+
+    def assert_not_called(self):
+        assert not self.call_args_list, self.call_args_list
+
+    def assert_called_once(self):
+        assert self.call_count == 1, self.call_args_list
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.call_args_list == [call(*args, **kwargs)], self.call_args_list
+
+
+class FakeRepo:
+    """Repository/service stub with an AsyncCallRecorder per named async method"""
+
+    def __init__(self, *methods: str):
+        self._methods = methods
+        for name in methods:
+            setattr(self, name, AsyncCallRecorder())
+
+    def reset(self):
+        """Reset every method stub"""
+        for name in self._methods:
+            getattr(self, name).reset()
+
+
+class FakeUoW:
+    """Unit of work stub: an async context manager exposing FakeRepo repositories
+
+    ``session`` stands in for the SQLAlchemy session that use cases hand to the
+    repositories they build themselves; tests patch those repositories out.
+    """
+
+    def __init__(self, **repos: FakeRepo):
+        self._repos = repos
+        for name, repo in repos.items():
+            setattr(self, name, repo)
+        self.session = None
+        self.commit = AsyncCallRecorder()
+        self.rollback = AsyncCallRecorder()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def reset(self):
+        """Reset every repository and the commit/rollback stubs"""
+        for repo in self._repos.values():
+            repo.reset()
+        self.commit.reset()
+        self.rollback.reset()
+
+
+def assert_kwargs(mock, **expected):
+    """Assert the mock's last call passed (at least) the expected keyword arguments"""
+    actual = mock.call_args.kwargs
+    assert {key: actual.get(key) for key in expected} == expected